@@ -0,0 +1,141 @@
+"""
+Static card images for Credit Card Finder MCP Server.
+Loads ui/assets/images/credit-cards once and serves it from memory with content-hash ETags.
+"""
+
+import asyncio
+import hashlib
+import io
+import logging
+import mimetypes
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+# Pillow is optional; it's only used to encode WebP variants when installed
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+CARD_IMAGES_DIR = Path(__file__).parent / "ui" / "assets" / "images" / "credit-cards"
+CARD_IMAGES_URL_PATH = "/assets/images/credit-cards"
+
+# Served for versioned URLs, whose content can never change
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Served for unversioned URLs: cache, but revalidate with the ETag
+REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+WEBP_QUALITY = 85
+# Encoder effort (0-6); 6 is ~20x slower than 4 for a few percent smaller files
+WEBP_METHOD = 4
+
+
+@dataclass(frozen=True)
+class ImageAsset:
+    """One image file with its content hash."""
+    filename: str
+    body: bytes
+    media_type: str
+    version: str                  # Content hash prefix, used in versioned URLs
+    etag: str
+
+    @classmethod
+    def load(cls, path: Path) -> "ImageAsset":
+        body = path.read_bytes()
+        digest = hashlib.sha256(body).hexdigest()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return cls(
+            filename=path.name,
+            body=body,
+            media_type=media_type,
+            version=digest[:16],
+            etag=f'"{digest[:32]}"',
+        )
+
+    @property
+    def url(self) -> str:
+        """Versioned URL path for this image, safe to cache forever."""
+        return f"{CARD_IMAGES_URL_PATH}/{self.filename}?v={self.version}"
+
+    @property
+    def webp_eligible(self) -> bool:
+        """Whether a WebP variant may exist (PNG source and Pillow installed)."""
+        return self.media_type == "image/png" and Image is not None
+
+
+def _to_webp(body: bytes) -> Optional[bytes]:
+    """Encode a PNG as WebP, or None if Pillow is unavailable or WebP isn't smaller."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(body)) as image:
+            output = io.BytesIO()
+            image.save(output, format="WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+    except (OSError, ValueError) as e:
+        logger.warning("⚠️  Could not encode WebP variant: %s", e)
+        return None
+    webp_body = output.getvalue()
+    return webp_body if len(webp_body) < len(body) else None
+
+
+class ImageStore:
+    """
+    Image files from one directory, read and hashed once, keyed by file name.
+
+    WebP variants are encoded on the first request that accepts them (in a
+    worker thread) and kept, so loading the store never waits on Pillow.
+    """
+
+    def __init__(self, assets: Dict[str, ImageAsset]):
+        self._assets = assets
+        self._webp_bodies: Dict[str, Optional[bytes]] = {}
+
+    @classmethod
+    def from_dir(cls, directory: Path = CARD_IMAGES_DIR) -> "ImageStore":
+        """Load every file in ``directory``; a missing directory gives an empty store."""
+        if not directory.is_dir():
+            logger.warning("⚠️  Card image directory not found: %s", directory)
+            return cls({})
+
+        assets = {
+            path.name: ImageAsset.load(path)
+            for path in sorted(directory.iterdir())
+            if path.is_file()
+        }
+        logger.info("🖼️  Loaded %d card image(s)", len(assets))
+        return cls(assets)
+
+    def get(self, filename: str) -> Optional[ImageAsset]:
+        return self._assets.get(filename)
+
+    async def webp_body(self, asset: ImageAsset) -> Optional[bytes]:
+        """WebP variant of ``asset``, or None if it has none (see ``_to_webp``)."""
+        if not asset.webp_eligible:
+            return None
+        if asset.filename not in self._webp_bodies:
+            # Concurrent first requests may both encode; the results are identical
+            self._webp_bodies[asset.filename] = await asyncio.to_thread(_to_webp, asset.body)
+        return self._webp_bodies[asset.filename]
+
+    def url_for(self, filename: str) -> Optional[str]:
+        """Versioned URL path for an image file name, or None if it isn't served."""
+        asset = self._assets.get(filename)
+        return asset.url if asset is not None else None
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+
+_card_images: Optional[ImageStore] = None
+
+
+def get_card_images() -> ImageStore:
+    """Get the process-wide card image store, loading it on first use."""
+    global _card_images
+    if _card_images is None:
+        _card_images = ImageStore.from_dir()
+    return _card_images
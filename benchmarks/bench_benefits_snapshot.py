@@ -0,0 +1,96 @@
+"""
+Benchmark fetch_reward_benefits_async served from the benefits snapshot.
+
+Populates a temporary snapshot directory from the stub upstream with
+refresh_benefits_snapshot, then compares request latency for all cards
+with no snapshot (upstream round trip per request, cache disabled) against
+latency served from the snapshot, and checks the snapshot path makes no
+upstream requests.
+
+To run:
+    python benchmarks/bench_benefits_snapshot.py [delay_seconds] [iterations]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ["BENEFITS_SNAPSHOT_ENABLED"] = "true"
+
+import service  # noqa: E402
+from benchmarks.stub_upstream import run_stub_upstream  # noqa: E402
+from snapshot import SnapshotStore  # noqa: E402
+
+CARD_TITLES = list(service.CARD_METADATA)
+
+
+async def _time_requests(iterations: int, clear_cache: bool) -> float:
+    """Average milliseconds per fetch_reward_benefits_async call for all cards."""
+    await service.fetch_reward_benefits_async(CARD_TITLES[:1])  # warm the client
+    elapsed = 0.0
+    for _ in range(iterations):
+        if clear_cache:
+            service.benefits_cache.clear()
+        start = time.perf_counter()
+        result = await service.fetch_reward_benefits_async(CARD_TITLES)
+        elapsed += time.perf_counter() - start
+        assert result["successful"] == len(CARD_TITLES), result["errors"]
+    return elapsed / iterations * 1000
+
+
+async def _run(iterations: int, stub, snapshot_dir: Path):
+    try:
+        # No snapshot: every call goes upstream and nothing is written through
+        service.BENEFITS_SNAPSHOT_ENABLED = False
+        upstream_ms = await _time_requests(iterations, clear_cache=True)
+
+        service.BENEFITS_SNAPSHOT_ENABLED = True
+        summary = await service.refresh_benefits_snapshot(max_age=0)
+        assert summary["refreshed"] == len(CARD_TITLES), summary
+
+        # A second refresh inside max_age leaves every snapshot alone
+        assert (await service.refresh_benefits_snapshot())["refreshed"] == 0
+
+        requests_before = stub.total_requests
+        service.benefits_cache.clear()
+        snapshot_ms = await _time_requests(iterations, clear_cache=True)
+        assert stub.total_requests == requests_before, "snapshot path reached upstream"
+
+        # A fresh store (e.g. another worker or a restart) reads the same files back
+        reloaded = SnapshotStore(snapshot_dir)
+        assert reloaded.load() == len(CARD_TITLES)
+        return upstream_ms, snapshot_ms
+    finally:
+        await service.close_http_client()
+
+
+def main(delay: float = 0.1, iterations: int = 20) -> None:
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp, run_stub_upstream(delay) as stub:
+        snapshot_dir = Path(tmp) / "benefit_terms"
+        service.BASE_URL = stub.base_url
+        service.benefits_snapshot = SnapshotStore(snapshot_dir)
+
+        upstream_ms, snapshot_ms = asyncio.run(_run(iterations, stub, snapshot_dir))
+        files = sorted(path.name for path in snapshot_dir.glob("*.json"))
+
+    print(f"fetch_reward_benefits_async for {len(CARD_TITLES)} cards, upstream delay {delay * 1000:.0f} ms")
+    print("-" * 56)
+    print(f"{'upstream, no snapshot':<32} {upstream_ms:>12.2f} ms/call")
+    print(f"{'served from snapshot':<32} {snapshot_ms:>12.2f} ms/call")
+    print("-" * 56)
+    print(f"speedup: {upstream_ms / snapshot_ms:.0f}x, snapshot files: {len(files)}")
+
+
+if __name__ == '__main__':
+    main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 0.1,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
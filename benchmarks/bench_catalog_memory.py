@@ -0,0 +1,92 @@
+"""
+Measure memory held by the parsed card data and the cost of building it.
+
+Compares the previous plain parse (``json.load`` of list_cards.json and
+every rates and fees document, one ``{**content, 'category': ...}`` record
+per listing entry) against the current loaders, which deduplicate equal
+values with ``share_json_values``, and a dict against a slotted
+``CardFacts`` record. Memory is what tracemalloc sees retained after the
+build; lookup time is per ``list_cards`` call.
+
+To run:
+    python benchmarks/bench_catalog_memory.py [iterations]
+"""
+
+import gc
+import json
+import logging
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import catalog  # noqa: E402
+from catalog import CARD_CATEGORIES, RATES_AND_FEES_DIR, CardCatalog, RatesStore, rates_and_fees_filename  # noqa: E402
+from service import CARD_CODE_TO_TITLE, get_comparison_facts, list_cards  # noqa: E402
+
+
+def _plain_records():
+    """Card records as the catalog built them before values were shared."""
+    data = json.loads(catalog.LIST_CARDS_PATH.read_text())
+    return [
+        {**item['content']['Component']['Content'], 'category': category}
+        for category in CARD_CATEGORIES
+        for item in data['componentObjects'].get(category, [])
+    ]
+
+
+def _plain_rates():
+    return {
+        code: json.loads((RATES_AND_FEES_DIR / rates_and_fees_filename(title)).read_text())
+        for code, title in CARD_CODE_TO_TITLE.items()
+    }
+
+
+def _shared_records():
+    return CardCatalog.from_data(json.loads(catalog.LIST_CARDS_PATH.read_text())).lookup()
+
+
+def _retained_kib(build) -> float:
+    """KiB still allocated after ``build()`` returns, while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return retained / 1024
+
+
+def main(iterations: int = 20) -> None:
+    logging.disable(logging.CRITICAL)
+
+    rows = [
+        ("card records, plain", _plain_records),
+        ("card records, shared", _shared_records),
+        ("rates and fees, plain", _plain_rates),
+        ("rates and fees, shared", lambda: RatesStore.from_dir(CARD_CODE_TO_TITLE)),
+        ("full catalog (with listing JSON)", lambda: CardCatalog.from_file()),
+    ]
+
+    print(f"{'structure':<34} {'retained KiB':>13} {'build ms':>10}")
+    print("-" * 60)
+    for label, build in rows:
+        kib = _retained_kib(build)
+        seconds = timeit.timeit(build, number=iterations) / iterations
+        print(f"{label:<34} {kib:>13.1f} {seconds * 1000:>10.2f}")
+
+    facts = get_comparison_facts().get("Active Cash")
+    as_dict = facts.to_dict()
+    print("-" * 60)
+    print(f"CardFacts record: {sys.getsizeof(facts)} bytes; as a dict: {sys.getsizeof(as_dict)} bytes")
+
+    lookup = timeit.timeit(lambda: list_cards(), number=iterations * 1000) / (iterations * 1000)
+    print(f"list_cards() lookup: {lookup * 1e6:.2f} µs per call (shared records, no per-call copies)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
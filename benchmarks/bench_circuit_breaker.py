@@ -0,0 +1,79 @@
+"""
+Benchmark fetch_reward_benefits_async during an upstream outage.
+
+Runs the stub upstream healthy (to collect latency samples for the
+p99-derived timeout), then returning 503 for every request, and reports
+per-call latency and upstream request counts as the circuit breaker opens,
+then recovers once the stub is healthy again and the reset timeout passes.
+
+To run:
+    python benchmarks/bench_circuit_breaker.py [delay_seconds]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Measure upstream fetches; don't serve from (or write to) the on-disk benefits snapshot
+os.environ["BENEFITS_SNAPSHOT_ENABLED"] = "false"
+os.environ["CIRCUIT_RESET_SECONDS"] = "1"
+
+import service  # noqa: E402
+from benchmarks.stub_upstream import run_stub_upstream  # noqa: E402
+
+CARD_TITLES = list(service.CARD_METADATA)
+
+
+async def _call(stub, label: str) -> dict:
+    service.benefits_cache.clear()
+    requests_before = stub.total_requests
+    start = time.perf_counter()
+    result = await service.fetch_reward_benefits_async(CARD_TITLES)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    breaker = service.get_circuit_breaker(stub.base_url).stats()
+    print(f"{label:<24} {elapsed_ms:>9.1f} ms {result['successful']:>3} ok {result['failed']:>3} failed "
+          f"{stub.total_requests - requests_before:>4} upstream req  {breaker['state']:<9} "
+          f"timeout {breaker['timeout_seconds']:.3f}s")
+    return result
+
+
+async def _run(stub) -> None:
+    try:
+        for i in range(3):
+            await _call(stub, f"healthy #{i + 1}")
+
+        stub.status = 503
+        for i in range(3):
+            await _call(stub, f"outage #{i + 1}")
+        assert service.get_circuit_breaker(stub.base_url).state == "open"
+
+        stub.status = 200
+        await _call(stub, "recovered, still open")
+        await asyncio.sleep(1.1)
+        result = await _call(stub, "after reset timeout")
+        assert result["successful"] >= 1
+        result = await _call(stub, "closed again")
+        assert result["successful"] == len(CARD_TITLES)
+    finally:
+        await service.close_http_client()
+
+
+def main(delay: float = 0.02) -> None:
+    logging.disable(logging.CRITICAL)
+
+    with run_stub_upstream(delay) as stub:
+        service.BASE_URL = stub.base_url
+        print(f"fetch_reward_benefits_async for {len(CARD_TITLES)} cards, upstream delay {delay * 1000:.0f} ms")
+        print("-" * 96)
+        asyncio.run(_run(stub))
+        print("-" * 96)
+        print(f"breaker: {service.circuit_breaker_stats()}")
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.02)
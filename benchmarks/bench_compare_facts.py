@@ -0,0 +1,87 @@
+"""
+Compare the two ways of building a compare_credit_cards table.
+
+Before: the model calls fetch_rewards_and_benefits and fetch_rates_and_fees
+for the cards and reads both payloads before writing benefit_rows itself.
+After: it calls compare_credit_cards without benefit_rows and the server
+fills them in from the comparison fact table. Reports the tool calls,
+bytes returned to the model and wall-clock time of each, with benefit terms
+served by a local stub upstream after a fixed delay.
+
+To run:
+    python benchmarks/bench_compare_facts.py [delay_seconds]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Measure upstream fetches; don't serve from (or write to) the on-disk benefits snapshot
+os.environ["BENEFITS_SNAPSHOT_ENABLED"] = "false"
+
+import mcp.types as types  # noqa: E402
+
+import service  # noqa: E402
+from benchmarks.stub_upstream import run_stub_upstream  # noqa: E402
+from tools import handle_tool_call  # noqa: E402
+
+CARDS = ["Active Cash", "Autograph", "Reflect"]
+
+
+async def _call(name: str, arguments: dict) -> int:
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments=arguments),
+    )
+    result = await handle_tool_call(request)
+    assert not getattr(result.root, "isError", False), result
+    return len(result.model_dump_json(by_alias=True, exclude_none=True).encode())
+
+
+async def _fetch_then_compare() -> int:
+    size = await _call("fetch_rewards_and_benefits", {"card_titles": CARDS})
+    size += await _call("fetch_rates_and_fees", {"card_titles": CARDS})
+    rows = service.compare_card_facts(CARDS)["benefit_rows"]  # stands in for the model's own rows
+    return size + await _call("compare_credit_cards", {"cards": CARDS, "benefit_rows": rows, "recommended_card": {"card_name": CARDS[0]}})
+
+
+async def _compare_from_facts() -> int:
+    return await _call("compare_credit_cards", {"cards": CARDS, "recommended_card": {"card_name": CARDS[0]}})
+
+
+async def _run():
+    service.get_http_client()
+    try:
+        results = []
+        for label, calls, flow in (("fetch + fetch + compare", 3, _fetch_then_compare), ("compare from facts", 1, _compare_from_facts)):
+            service.benefits_cache.clear()
+            start = time.perf_counter()
+            size = await flow()
+            results.append((label, calls, size, time.perf_counter() - start))
+        return results
+    finally:
+        await service.close_http_client()
+
+
+def main(delay: float = 0.2) -> None:
+    logging.disable(logging.CRITICAL)
+    service.get_comparison_facts()
+
+    with run_stub_upstream(delay) as stub:
+        service.BASE_URL = stub.base_url
+        results = asyncio.run(_run())
+
+    print(f"comparison of {len(CARDS)} cards, upstream delay {delay * 1000:.0f} ms (cold benefits cache)")
+    print("-" * 64)
+    print(f"{'flow':<26} {'calls':>6} {'bytes to model':>15} {'ms':>12}")
+    for label, calls, size, seconds in results:
+        print(f"{label:<26} {calls:>6} {size:>15} {seconds * 1000:>12.1f}")
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.2)
@@ -0,0 +1,89 @@
+"""
+Benchmark wall-clock time of fetching reward benefits for N cards.
+
+Runs the previous sequential implementation (one blocking ``requests.get``
+per card, kept here for comparison) and the concurrent
+``fetch_reward_benefits_async`` against a local stub upstream that delays
+every response, and checks that the async fetch of N cards takes about as
+long as a single request.
+
+To run:
+    python benchmarks/bench_fetch_reward_benefits.py [delay_seconds]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Measure upstream fetches; don't serve from (or write to) the on-disk benefits snapshot
+os.environ["BENEFITS_SNAPSHOT_ENABLED"] = "false"
+
+import service  # noqa: E402
+from benchmarks.stub_upstream import run_stub_upstream  # noqa: E402
+
+
+def _fetch_reward_benefits_sequential(card_titles):
+    """Previous fetch_reward_benefits: one blocking request per card, in turn."""
+    results = {}
+    errors = {}
+    for card_title in card_titles:
+        full_url = f"{service.BASE_URL}{service._get_card_feature_benefit_url(card_title)}"
+        try:
+            response = requests.get(full_url, timeout=10)
+            response.raise_for_status()
+            results[card_title] = {"data": response.json(), "url": full_url}
+        except (requests.exceptions.RequestException, ValueError) as e:
+            errors[card_title] = str(e)
+    return {"successful": len(results), "failed": len(errors), "errors": errors or None}
+
+
+async def _time_async(card_titles):
+    """Time one card and then all cards over an already-created shared client."""
+    service.get_http_client()
+    try:
+        start = time.perf_counter()
+        await service.fetch_reward_benefits_async(card_titles[:1])
+        single_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = await service.fetch_reward_benefits_async(card_titles)
+        return single_s, time.perf_counter() - start, result
+    finally:
+        await service.close_http_client()
+
+
+def main(delay: float = 0.2) -> None:
+    logging.disable(logging.CRITICAL)
+    card_titles = list(service.CARD_METADATA)
+
+    with run_stub_upstream(delay) as stub:
+        service.BASE_URL = stub.base_url
+
+        start = time.perf_counter()
+        sequential = _fetch_reward_benefits_sequential(card_titles)
+        sequential_s = time.perf_counter() - start
+
+        single_s, concurrent_s, concurrent = asyncio.run(_time_async(card_titles))
+
+    assert sequential["successful"] == concurrent["successful"] == len(card_titles), concurrent["errors"]
+
+    print(f"reward benefits for {len(card_titles)} cards, upstream delay {delay * 1000:.0f} ms")
+    print("-" * 56)
+    print(f"{'sequential (requests)':<32} {sequential_s * 1000:>12.1f} ms")
+    print(f"{'single card (httpx.AsyncClient)':<32} {single_s * 1000:>12.1f} ms")
+    print(f"{'concurrent (httpx.AsyncClient)':<32} {concurrent_s * 1000:>12.1f} ms")
+    print("-" * 56)
+    print(f"concurrent / single request: {concurrent_s / single_s:.2f}x")
+
+    assert concurrent_s < 2 * single_s, "concurrent fetch should take about one request's time"
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.2)
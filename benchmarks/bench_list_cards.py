@@ -0,0 +1,58 @@
+"""
+Benchmark per-call latency of list_cards.
+
+Compares the previous behaviour (open and parse json/list_cards.json on every
+call) against the in-memory card catalog.
+
+To run:
+    python benchmarks/bench_list_cards.py [iterations]
+"""
+
+import json
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catalog import CARD_CATEGORIES, LIST_CARDS_PATH  # noqa: E402
+from service import get_catalog, list_cards  # noqa: E402
+
+
+def _list_cards_from_disk():
+    """Previous list_cards implementation: parse the file and flatten on every call."""
+    with open(LIST_CARDS_PATH, 'r') as f:
+        data = json.load(f)
+    component_objects = data.get('componentObjects', {})
+    all_cards = []
+    for cat in CARD_CATEGORIES:
+        for item in component_objects.get(cat, []):
+            content = item['content']['Component']['Content']
+            all_cards.append({**content, 'category': cat})
+    return all_cards
+
+
+def _report(label: str, seconds: float, iterations: int) -> float:
+    per_call_us = seconds / iterations * 1e6
+    print(f"{label:<32} {per_call_us:>12.1f} µs/call")
+    return per_call_us
+
+
+def main(iterations: int = 2000) -> None:
+    # Keep log formatting out of the measurement
+    logging.disable(logging.CRITICAL)
+
+    get_catalog()
+    assert len(_list_cards_from_disk()) == len(list_cards())
+
+    print(f"list_cards latency over {iterations} calls")
+    print("-" * 56)
+    before = _report("per-call json.load (before)", timeit.timeit(_list_cards_from_disk, number=iterations), iterations)
+    after = _report("in-memory catalog (after)", timeit.timeit(list_cards, number=iterations), iterations)
+    print("-" * 56)
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,65 @@
+"""
+Microbenchmark list_tools latency.
+
+Compares rebuilding the tool definitions and JSON schemas on every call
+(previous behaviour) against the cached ListToolsResult, both with and
+without the JSON serialization the transport performs.
+
+To run:
+    python benchmarks/bench_list_tools.py [iterations]
+"""
+
+import asyncio
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mcp.types as types  # noqa: E402
+
+import schemas  # noqa: E402
+import tools  # noqa: E402
+from mcp_handlers import list_tools_handler  # noqa: E402
+
+
+def _rebuild_result() -> types.ServerResult:
+    """Previous behaviour: regenerate schemas and tools for every request."""
+    schemas.get_schemas.cache_clear()
+    return types.ServerResult(types.ListToolsResult(tools=tools.build_tool_definitions()))
+
+
+def _serialize(result: types.ServerResult) -> str:
+    return result.model_dump_json(by_alias=True, exclude_none=True)
+
+
+def _report(label: str, seconds: float, iterations: int) -> float:
+    per_call_us = seconds / iterations * 1e6
+    print(f"{label:<36} {per_call_us:>12.1f} µs/call")
+    return per_call_us
+
+
+def main(iterations: int = 500) -> None:
+    logging.disable(logging.CRITICAL)
+    request = types.ListToolsRequest(method="tools/list")
+    loop = asyncio.new_event_loop()
+
+    def cached_handler():
+        return loop.run_until_complete(list_tools_handler(request))
+
+    assert _serialize(_rebuild_result()) == _serialize(cached_handler())
+
+    print(f"list_tools latency over {iterations} calls")
+    print("-" * 60)
+    before = _report("rebuild per call (before)", timeit.timeit(_rebuild_result, number=iterations), iterations)
+    after = _report("cached result (after)", timeit.timeit(cached_handler, number=iterations), iterations)
+    before_json = _report("rebuild + serialize (before)", timeit.timeit(lambda: _serialize(_rebuild_result()), number=iterations), iterations)
+    after_json = _report("cached + serialize (after)", timeit.timeit(lambda: _serialize(cached_handler()), number=iterations), iterations)
+    print("-" * 60)
+    print(f"speedup: {before / after:.1f}x handler only, {before_json / after_json:.1f}x including serialization")
+    loop.close()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,69 @@
+"""
+Benchmark card listing serialization.
+
+Compares the previous per-call ``json.dumps(..., indent=2)`` of the full
+card listing against the text precomputed by the catalog, and reports
+payload size and encode time for pretty vs compact output with the
+standard library encoder and orjson (when installed).
+
+To run:
+    python benchmarks/bench_listing_json.py [iterations]
+"""
+
+import json
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import catalog  # noqa: E402
+from catalog import CardCatalog  # noqa: E402
+from service import get_catalog, list_cards  # noqa: E402
+
+
+def _document():
+    cards = list_cards()
+    return {"message": f"Successfully retrieved all {len(cards)} Wells Fargo credit cards.", "count": len(cards), "cards": cards}
+
+
+def _encoders():
+    yield "json indent=2 (before)", lambda doc: json.dumps(doc, indent=2)
+    yield "json indent=2, raw unicode", lambda doc: json.dumps(doc, ensure_ascii=False, indent=2)
+    yield "json compact", lambda doc: json.dumps(doc, ensure_ascii=False, separators=(",", ":"))
+    if catalog.orjson is not None:
+        orjson = catalog.orjson
+        yield "orjson indent=2", lambda doc: orjson.dumps(doc, option=orjson.OPT_INDENT_2).decode("utf-8")
+        yield "orjson compact", lambda doc: orjson.dumps(doc).decode("utf-8")
+
+
+def main(iterations: int = 500) -> None:
+    logging.disable(logging.CRITICAL)
+    document = _document()
+
+    print(f"get_all_credit_cards payload ({document['count']} cards), {iterations} iterations")
+    print("-" * 64)
+    print(f"{'encoder':<30} {'bytes':>10} {'encode µs':>12}")
+    for label, encode in _encoders():
+        size = len(encode(document).encode("utf-8"))
+        seconds = timeit.timeit(lambda: encode(document), number=iterations)
+        print(f"{label:<30} {size:>10} {seconds / iterations * 1e6:>12.1f}")
+
+    print("-" * 64)
+    before = timeit.timeit(lambda: json.dumps(_document(), indent=2), number=iterations) / iterations
+    listing_json = get_catalog().listing_json
+    after = timeit.timeit(lambda: listing_json(), number=iterations) / iterations
+    print(f"{'per call: dumps (before)':<30} {before * 1e6:>23.1f} µs")
+    print(f"{'per call: precomputed (after)':<30} {after * 1e6:>23.1f} µs")
+    print(f"speedup: {before / after:.0f}x")
+
+    data = json.loads(catalog.LIST_CARDS_PATH.read_text())
+    for compact in (False, True):
+        build = timeit.timeit(lambda: CardCatalog.from_data(data, compact_json=compact), number=20) / 20
+        total = sum(len(text.encode("utf-8")) for text in CardCatalog.from_data(data, compact_json=compact)._listing_json.values())
+        print(f"catalog build, {'compact' if compact else 'pretty '} listings: {build * 1000:.2f} ms, {total} bytes held")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,248 @@
+"""
+Load test the MCP server by replaying recorded tool-call sessions.
+
+Each session is an MCP streamable-HTTP conversation: ``initialize``, then
+the steps of one entry from ``mcp_traffic.jsonl`` (tools/list, listing,
+rewards and benefits, rates and fees, comparison), picked at random by the
+entry's weight. Sessions run against ``server:app`` in-process (over
+``httpx.ASGITransport``) or over localhost (uvicorn in a subprocess), with
+upstream Wells Fargo calls going to a local stub.
+
+Reports throughput, p50/p95/p99 latency per tool and, in-process, memory
+allocated per request (peak and retained, measured with tracemalloc in a
+separate single-client pass so tracing doesn't skew the latencies).
+
+To run:
+    python benchmarks/bench_mcp_load.py [sessions] [concurrency] [inprocess|localhost] [upstream_delay_seconds]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Exercise the upstream path; don't serve from (or write to) the on-disk benefits snapshot
+os.environ["BENEFITS_SNAPSHOT_ENABLED"] = "false"
+
+from benchmarks.bench_workers import _free_port, _wait_ready  # noqa: E402
+from benchmarks.stub_upstream import run_stub_upstream  # noqa: E402
+
+TRAFFIC_PATH = Path(__file__).parent / "mcp_traffic.jsonl"
+MCP_PATH = "/mcp"
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+INITIALIZE_PARAMS = {
+    "protocolVersion": "2025-06-18",
+    "capabilities": {},
+    "clientInfo": {"name": "bench_mcp_load", "version": "1.0.0"},
+}
+
+
+def load_traffic(path: Path = TRAFFIC_PATH) -> List[Dict[str, Any]]:
+    """Load the weighted session templates, one JSON object per line."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _label(step: Dict[str, Any]) -> str:
+    """Report tool calls by tool name and everything else by method."""
+    if step["method"] == "tools/call":
+        return step["params"]["name"]
+    return step["method"]
+
+
+def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+    """Get the JSON-RPC message from a JSON or single-event SSE response."""
+    response.raise_for_status()
+    if response.headers.get("content-type", "").startswith("text/event-stream"):
+        for line in response.text.splitlines():
+            if line.startswith("data:"):
+                return json.loads(line[5:])
+        raise ValueError("event stream carried no message")
+    return response.json()
+
+
+class SessionRunner:
+    """Replays sessions over one HTTP client and records per-step latencies."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.requests = 0
+        self._next_id = 0
+
+    async def request(self, label: str, method: str, params: Dict[str, Any]) -> None:
+        self._next_id += 1
+        message = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+        start = time.perf_counter()
+        try:
+            reply = _parse_response(await self.client.post(MCP_PATH, json=message, headers=HEADERS))
+            failed = "error" in reply or reply.get("result", {}).get("isError", False)
+        except (httpx.HTTPError, ValueError):
+            failed = True
+        self.latencies[label].append(time.perf_counter() - start)
+        self.requests += 1
+        if failed:
+            self.errors[label] += 1
+
+    async def run_session(self, steps: List[Dict[str, Any]]) -> None:
+        await self.request("initialize", "initialize", INITIALIZE_PARAMS)
+        await self.client.post(MCP_PATH, json={"jsonrpc": "2.0", "method": "notifications/initialized"}, headers=HEADERS)
+        for step in steps:
+            await self.request(_label(step), step["method"], step.get("params", {}))
+
+
+def _pick_sessions(traffic: List[Dict[str, Any]], count: int, seed: int = 0) -> List[List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+    entries = rng.choices(traffic, weights=[entry.get("weight", 1) for entry in traffic], k=count)
+    return [entry["steps"] for entry in entries]
+
+
+async def _drive(client: httpx.AsyncClient, sessions: List[List[Dict[str, Any]]], concurrency: int) -> Tuple[SessionRunner, float]:
+    runner = SessionRunner(client)
+    queue = iter(sessions)
+
+    async def worker():
+        for steps in queue:
+            await runner.run_session(steps)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return runner, time.perf_counter() - start
+
+
+async def _measure_allocations(client: httpx.AsyncClient, sessions: List[List[Dict[str, Any]]]) -> Dict[str, Tuple[float, float]]:
+    """Per step label: mean peak and mean retained KiB allocated while serving one request."""
+    peaks: Dict[str, List[int]] = defaultdict(list)
+    retained: Dict[str, List[int]] = defaultdict(list)
+    runner = SessionRunner(client)
+
+    tracemalloc.start()
+    try:
+        for steps in sessions:
+            await runner.run_session([])  # initialize outside the measurement
+            for step in steps:
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                await runner.request(_label(step), step["method"], step.get("params", {}))
+                after, peak = tracemalloc.get_traced_memory()
+                peaks[_label(step)].append(peak - before)
+                retained[_label(step)].append(after - before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        label: (statistics.mean(peaks[label]) / 1024, statistics.mean(retained[label]) / 1024)
+        for label in peaks
+    }
+
+
+async def _run_inprocess(sessions, concurrency):
+    import service
+    from server import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _drive(client, sessions[:concurrency], concurrency)  # warm up caches and connections
+            runner, elapsed = await _drive(client, sessions, concurrency)
+            allocations = await _measure_allocations(client, sessions[:min(len(sessions), 20)])
+        await service.close_http_client()
+    return runner, elapsed, allocations
+
+
+async def _run_localhost(base_url, sessions, concurrency):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        await _drive(client, sessions[:concurrency], concurrency)
+        runner, elapsed = await _drive(client, sessions, concurrency)
+    return runner, elapsed, None
+
+
+def _start_server(port: int, upstream_url: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "UPSTREAM_BASE_URL": upstream_url,
+        "LOG_LEVEL": "WARNING",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _report(runner: SessionRunner, elapsed: float, allocations) -> None:
+    print(f"{runner.requests} requests in {elapsed:.2f}s: {runner.requests / elapsed:.0f} req/s")
+    print("-" * 96)
+    header = f"{'step':<32} {'count':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    if allocations is not None:
+        header += f" {'peak KiB':>9} {'kept KiB':>9}"
+    print(header)
+    for label, values in runner.latencies.items():
+        values = sorted(values)
+        line = (
+            f"{label:<32} {len(values):>6} {runner.errors[label]:>6}"
+            f" {_percentile(values, 50) * 1000:>8.2f} {_percentile(values, 95) * 1000:>8.2f} {_percentile(values, 99) * 1000:>8.2f}"
+        )
+        if allocations is not None:
+            peak, kept = allocations.get(label, (0.0, 0.0))
+            line += f" {peak:>9.1f} {kept:>9.1f}"
+        print(line)
+
+
+def main(sessions: int = 200, concurrency: int = 8, mode: str = "inprocess", delay: float = 0.05) -> None:
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter("ignore", DeprecationWarning)
+    picked = _pick_sessions(load_traffic(), sessions)
+
+    with run_stub_upstream(delay) as stub:
+        if mode == "inprocess":
+            import service
+            service.BASE_URL = stub.base_url
+            runner, elapsed, allocations = asyncio.run(_run_inprocess(picked, concurrency))
+        elif mode == "localhost":
+            port = _free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            process = _start_server(port, stub.base_url)
+            try:
+                _wait_ready(base_url)
+                runner, elapsed, allocations = asyncio.run(_run_localhost(base_url, picked, concurrency))
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+        else:
+            raise SystemExit(f"unknown mode {mode!r}; expected 'inprocess' or 'localhost'")
+        upstream_requests = stub.total_requests
+
+    print(f"MCP load test ({mode}): {sessions} sessions, {concurrency} concurrent clients, upstream delay {delay * 1000:.0f} ms")
+    print(f"upstream requests: {upstream_requests}")
+    _report(runner, elapsed, allocations)
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+        sys.argv[3] if len(sys.argv) > 3 else "inprocess",
+        float(sys.argv[4]) if len(sys.argv) > 4 else 0.05,
+    )
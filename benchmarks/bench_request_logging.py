@@ -0,0 +1,71 @@
+"""
+Benchmark per-request handler overhead at a given log level.
+
+Calls the MCP request handlers in-process with logging configured like the
+server (root logger at LOG_LEVEL, default INFO) but writing to /dev/null, and
+reports per-request latency so logging cost can be compared across levels.
+
+To run:
+    python benchmarks/bench_request_logging.py [iterations] [level]
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mcp.types as types  # noqa: E402
+
+from mcp_handlers import (  # noqa: E402
+    list_resource_templates_handler,
+    list_resources_handler,
+    read_resource_handler,
+)
+from tools import handle_tool_call  # noqa: E402
+
+
+def _call_tool(name, arguments):
+    return types.CallToolRequest(method="tools/call", params=types.CallToolRequestParams(name=name, arguments=arguments))
+
+
+REQUESTS = [
+    ("list_resources", list_resources_handler, ()),
+    ("list_resource_templates", list_resource_templates_handler, ()),
+    ("read_resource", read_resource_handler, (
+        types.ReadResourceRequest(method="resources/read", params=types.ReadResourceRequestParams(uri="ui://widget/card-list.html")),
+    )),
+    ("list_wells_fargo_credit_cards", handle_tool_call, (_call_tool("list_wells_fargo_credit_cards", {"category": "travel"}),)),
+    ("fetch_rates_and_fees", handle_tool_call, (_call_tool("fetch_rates_and_fees", {"card_titles": ["Active Cash", "Reflect"]}),)),
+]
+
+
+def main(iterations: int = 2000, level: str = "INFO") -> None:
+    with open(os.devnull, "w") as devnull:
+        logging.basicConfig(level=level, handlers=[logging.StreamHandler(devnull)], force=True)
+        loop = asyncio.new_event_loop()
+
+        print(f"per-request latency at {level} over {iterations} calls")
+        print("-" * 56)
+        for label, handler, args in REQUESTS:
+            def call():
+                return loop.run_until_complete(handler(*args))
+
+            # Anything written straight to stderr counts towards the request cost
+            with contextlib.redirect_stderr(devnull):
+                call()
+                seconds = timeit.timeit(call, number=iterations)
+            print(f"{label:<32} {seconds / iterations * 1e6:>12.1f} µs/call")
+
+        loop.close()
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        sys.argv[2].upper() if len(sys.argv) > 2 else os.getenv("LOG_LEVEL", "INFO").upper(),
+    )
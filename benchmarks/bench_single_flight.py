@@ -0,0 +1,62 @@
+"""
+Check request coalescing for concurrent identical benefit fetches.
+
+Fires many concurrent ``fetch_reward_benefits_async`` calls for the same
+cards (as a tool call and widget clicks would) against a counting local stub
+upstream, and checks that each card code is requested upstream only once.
+
+To run:
+    python benchmarks/bench_single_flight.py [concurrent_callers]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Measure upstream fetches; don't serve from (or write to) the on-disk benefits snapshot
+os.environ["BENEFITS_SNAPSHOT_ENABLED"] = "false"
+
+import service  # noqa: E402
+from benchmarks.stub_upstream import run_stub_upstream  # noqa: E402
+
+
+async def _fetch_concurrently(callers: int, card_titles):
+    try:
+        return await asyncio.gather(*(
+            service.fetch_reward_benefits_async(card_titles) for _ in range(callers)
+        ))
+    finally:
+        await service.close_http_client()
+
+
+def main(callers: int = 50) -> None:
+    logging.disable(logging.CRITICAL)
+    # Different spellings of the same cards still share one fetch per card code
+    card_titles = ["Active Cash", "Active Cash<sup>®</sup>", "Reflect®"]
+
+    with run_stub_upstream(0.1) as stub:
+        service.BASE_URL = stub.base_url
+        service.benefits_cache.clear()
+
+        start = time.perf_counter()
+        results = asyncio.run(_fetch_concurrently(callers, card_titles))
+        elapsed_s = time.perf_counter() - start
+
+    assert all(result["successful"] == len(card_titles) for result in results)
+
+    print(f"{callers} concurrent callers x {len(card_titles)} card titles in {elapsed_s * 1000:.1f} ms")
+    print("-" * 56)
+    for key, count in sorted(stub.requests.items()):
+        print(f"{key:<32} {count:>6} upstream request(s)")
+    print(f"single-flight: {service.benefits_flights.stats()}")
+
+    assert stub.requests == {"AC_benefitTerms": 1, "VV_benefitTerms": 1}, stub.requests
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,72 @@
+"""
+Measure the list_wells_fargo_credit_cards payload for the full, deduplicated and summary views.
+
+Serializes each tool result the way the transport does and reports the bytes
+sent to the client and an estimate of the tokens the model reads for every
+category. Tokens are counted with tiktoken (cl100k_base) when installed,
+otherwise estimated at 4 characters per token.
+
+To run:
+    python benchmarks/bench_summary_projection.py
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mcp.types as types  # noqa: E402
+
+from tools import handle_tool_call  # noqa: E402
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _encoding = None
+
+CATEGORIES = ("all", "cashback", "travel", "introrate", "rewards")
+
+
+def _count_tokens(text: str) -> int:
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return round(len(text) / 4)
+
+
+# Label -> extra tool arguments
+VARIANTS = {
+    "full": {},
+    "dedupe": {"dedupe": True},
+    "summary": {"view": "summary"},
+}
+
+
+async def _payload(category: str, arguments: dict) -> str:
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name="list_wells_fargo_credit_cards", arguments={"category": category, **arguments}),
+    )
+    result = await handle_tool_call(request)
+    return result.model_dump_json(by_alias=True, exclude_none=True)
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    unit = "tokens" if _encoding is not None else "~tokens"
+
+    print(f"{'category':<10} {'variant':<8} {'bytes':>8} {'saved':>7} {unit:>8}")
+    print("-" * 46)
+    for category in CATEGORIES:
+        full_bytes = None
+        for label, arguments in VARIANTS.items():
+            payload = asyncio.run(_payload(category, arguments))
+            size = len(payload.encode())
+            full_bytes = full_bytes or size
+            print(f"{category:<10} {label:<8} {size:>8} {1 - size / full_bytes:>6.0%} {_count_tokens(payload):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Load test throughput of the multi-worker launch mode.
+
+Starts ``gunicorn -c gunicorn.conf.py server:app`` with 1, 2, 4... workers on
+a free localhost port, drives it with concurrent keep-alive clients for a
+fixed duration, and reports requests per second for each worker count.
+Throughput can only scale up to the number of CPUs available to the test
+(the load generator shares them with the workers).
+
+To run:
+    python benchmarks/bench_workers.py [max_workers] [seconds_per_run]
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+PATH = "/api/fetch_rates_and_fees?card_title=Autograph%20Journey"
+CONCURRENCY = 8
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(workers),
+        "SERVER_HOST": "127.0.0.1",
+        "SERVER_PORT": str(port),
+        "LOG_LEVEL": "WARNING",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "server:app"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not become ready")
+
+
+async def _drive(base_url: str, seconds: float) -> int:
+    limits = httpx.Limits(max_connections=CONCURRENCY, max_keepalive_connections=CONCURRENCY)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        deadline = time.monotonic() + seconds
+        completed = 0
+
+        async def worker():
+            nonlocal completed
+            while time.monotonic() < deadline:
+                response = await client.get(PATH)
+                response.raise_for_status()
+                completed += 1
+
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        return completed
+
+
+def main(max_workers: int = 4, seconds: float = 5.0) -> None:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+
+    print(f"throughput for GET {PATH}, {CONCURRENCY} concurrent clients, {seconds:g}s per run")
+    print(f"CPUs available: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+    print("-" * 56)
+
+    baseline = None
+    for workers in counts:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = _start_server(workers, port)
+        try:
+            _wait_ready(base_url)
+            asyncio.run(_drive(base_url, 1.0))  # warm up connections and workers
+            completed = asyncio.run(_drive(base_url, seconds))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+        rps = completed / seconds
+        baseline = baseline or rps
+        print(f"{workers:>2} worker(s) {rps:>12.0f} req/s {rps / baseline:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 4,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 5.0,
+    )
@@ -0,0 +1,85 @@
+"""
+Local stand-in for the Wells Fargo footnotes endpoint used by benchmarks.
+
+Serves ``/as/getFootnotes?key=<CODE>_benefitTerms`` with a small JSON body
+after a fixed delay and counts the requests it receives per key. Set
+``status`` to an error code (e.g. 503) to simulate an upstream outage.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+
+
+class StubUpstream(ThreadingHTTPServer):
+    """Threaded HTTP server that records request counts per footnote key."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _FootnotesHandler)
+        self.delay = delay
+        self.status = 200
+        self.requests: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self.requests.values())
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            self.requests[key] += 1
+
+    def handle_error(self, request, client_address):
+        # Clients that hit their deadline hang up mid-response; that's expected here
+        pass
+
+
+class _FootnotesHandler(BaseHTTPRequestHandler):
+    server: StubUpstream
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        key = query.get("key", [""])[0]
+        self.server.record(key)
+        time.sleep(self.server.delay)
+
+        if self.server.status != 200:
+            self.send_error(self.server.status)
+            return
+
+        body = json.dumps({"data": {"key": key, "footnotes": [f"Stub benefit terms for {key}"]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def run_stub_upstream(delay: float = 0.0) -> Iterator[StubUpstream]:
+    """Run a StubUpstream on a free localhost port for the duration of the block."""
+    server = StubUpstream(delay)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
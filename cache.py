@@ -0,0 +1,173 @@
+"""
+Response caching for Credit Card Finder MCP Server.
+Provides a bounded TTL cache that serves stale entries while refreshing them in the background,
+and request coalescing for concurrent identical upstream fetches.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from cachetools import LRUCache
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    stored_at: float
+
+
+class StaleWhileRevalidateCache:
+    """
+    Bounded LRU cache with a freshness TTL and stale-while-revalidate reads.
+
+    Entries younger than ``ttl`` are served as fresh. Older entries are still
+    served (up to ``max_stale`` seconds past the TTL) while a single background
+    refresh replaces them. Only the event loop thread may use the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        max_stale: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._timer = timer
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        # Counters for sizing the cache
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """
+        Look up a cached value.
+
+        Returns:
+            Tuple of (value, is_stale), or None on a miss or when the entry
+            is older than ``ttl + max_stale``
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        age = self._timer() - entry.stored_at
+        if age < self.ttl:
+            self.hits += 1
+            return entry.value, False
+
+        if self.max_stale is not None and age >= self.ttl + self.max_stale:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self.stale_hits += 1
+        return entry.value, True
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a fresh value."""
+        self._entries[key] = _Entry(value, self._timer())
+
+    def revalidate(self, key: Hashable, fetch: Callable[[], Awaitable[Optional[Any]]]) -> None:
+        """
+        Refresh ``key`` in the background unless a refresh is already running.
+
+        ``fetch`` returns the new value, or None if it could not be fetched,
+        in which case the stale entry is kept.
+        """
+        if key in self._refreshing:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._refresh(key, fetch))
+        self._refreshing[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Optional[Any]]]) -> None:
+        try:
+            value = await fetch()
+        except Exception as e:
+            value = None
+            logger.error("❌ Background refresh failed for %r: %s", key, e)
+        finally:
+            self._refreshing.pop(key, None)
+
+        if value is None:
+            self.refresh_failures += 1
+            return
+
+        self.refreshes += 1
+        self.set(key, value)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters and sizing information."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "max_stale_seconds": self.max_stale,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "refreshing": len(self._refreshing),
+        }
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one in-flight call.
+
+    The first caller for a key starts ``fetch``; callers arriving while it runs
+    await the same result. The shared call is shielded, so one caller being
+    cancelled (e.g. by a deadline) doesn't cancel it for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        # Counters for observing coalescing
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fetch`` for ``key``, or join the call already in flight."""
+        self.calls += 1
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing counters."""
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": len(self._inflight),
+        }
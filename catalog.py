@@ -0,0 +1,653 @@
+"""
+In-memory card data for Credit Card Finder MCP Server.
+Parses json/list_cards.json and json/rates_and_fees/*.json once and serves lookups from memory.
+"""
+
+import html
+import json
+import logging
+import re
+import sys
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# orjson is optional; it's only used to serialize listings faster when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Title normalization patterns
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_TRADEMARK_RE = re.compile(r'[®™℠]')
+
+# Data files live next to this module so lookups don't depend on the working directory
+DATA_DIR = Path(__file__).parent / "json"
+LIST_CARDS_PATH = DATA_DIR / "list_cards.json"
+RATES_AND_FEES_DIR = DATA_DIR / "rates_and_fees"
+BENEFIT_TERMS_DIR = DATA_DIR / "benefit_terms"
+
+# Categories exposed by list_cards.json, in listing order
+CARD_CATEGORIES = ("cashback", "travel", "introrate", "rewards")
+
+# Immutable, shared result of a catalog lookup
+CardList = Tuple[Dict[str, Any], ...]
+
+# Index key: (category or None for all categories, no_annual_fee filter or None)
+IndexKey = Tuple[Optional[str], Optional[bool]]
+
+# Index key of the listing with no category or annual fee filter
+UNFILTERED_KEY: IndexKey = (None, None)
+
+# Card fields the card list widget renders; the summary projection keeps only these
+SUMMARY_FIELDS = ("title", "subtitle")
+SUMMARY_FIRST_ITEM_FIELDS = ("feature4_content", "feature5_content", "feature6_content")
+
+
+class DataLoadError(Exception):
+    """Raised when a required card data file is missing or invalid."""
+
+
+def classify_annual_fee(card: Dict[str, Any]) -> Optional[bool]:
+    """
+    Classify a card's annual fee from its ``feature6_content``.
+
+    Returns:
+        True if the card has no annual fee, False if it has one,
+        or None if the card carries no fee information
+    """
+    fee_content = card.get('feature6_content', [])
+    if not fee_content:
+        return None
+
+    fee_text = fee_content[0].strip()
+    return fee_text == '$0' or 'none' in fee_text.lower() or fee_text == '0'
+
+
+@lru_cache(maxsize=1024)
+def clean_card_title(card_title: str) -> str:
+    """Strip HTML tags and superscript characters (®, ™, ℠) from a card title."""
+    return _TRADEMARK_RE.sub('', _HTML_TAG_RE.sub('', card_title)).strip()
+
+
+def share_json_values(value: Any, memo: Optional[Dict[Any, Any]] = None) -> Any:
+    """
+    Deduplicate a parsed JSON value so equal parts are stored once.
+
+    Strings are interned, and lists and dicts with equal contents are replaced
+    by one shared object (bottom-up, so nested containers are compared by
+    identity). list_cards.json repeats each card under every category it
+    belongs to, and the rates and fees documents repeat the same labels and
+    boilerplate, so most of their contents end up shared. Pass the same
+    ``memo`` to share across several documents. The result must be treated
+    as read-only.
+    """
+    if memo is None:
+        memo = {}
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        items = [share_json_values(item, memo) for item in value]
+        key = ('list', tuple(_identity_key(item) for item in items))
+        return memo.setdefault(key, items)
+    if isinstance(value, dict):
+        entries = {sys.intern(k): share_json_values(v, memo) for k, v in value.items()}
+        key = ('dict', tuple((k, _identity_key(v)) for k, v in entries.items()))
+        return memo.setdefault(key, entries)
+    return value
+
+
+def _identity_key(value: Any) -> Any:
+    """Hashable key for an already shared JSON value: containers by identity, scalars by type and value."""
+    if isinstance(value, (list, dict)):
+        return id(value)
+    return (type(value), value)
+
+
+def dumps_json(value: Any, compact: bool = False) -> str:
+    """
+    Serialize a value to JSON text, with orjson when it is installed.
+
+    Non-ASCII characters (®, ™, ℠) are written as-is rather than escaped.
+    ``compact`` drops the two-space indentation and whitespace.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=0 if compact else orjson.OPT_INDENT_2).decode("utf-8")
+    if compact:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def describe_filters(category: Optional[str], no_annual_fee: Optional[bool]) -> str:
+    """Describe a listing's filters for messages, e.g. "in travel category with no annual fee"."""
+    filter_parts = []
+    if category is not None:
+        filter_parts.append(f"in {category} category")
+    if no_annual_fee is True:
+        filter_parts.append("with no annual fee")
+    elif no_annual_fee is False:
+        filter_parts.append("with annual fee")
+    return " ".join(filter_parts)
+
+
+class CardCatalog:
+    """
+    Flattened card records grouped by category.
+
+    Each record is the card's raw ``Content`` dict plus a ``category`` key,
+    built once when the catalog is loaded. Values are deduplicated with
+    ``share_json_values``, so a card listed under several categories stores
+    its content once. Records are shared between calls and must be treated
+    as read-only by callers.
+
+    Every ``(category, no_annual_fee)`` filter combination is precomputed
+    into a posting list at construction, so lookups are a single dict hit.
+    The JSON text of the unfiltered listing, the only one the tools serve,
+    is serialized at construction too (see ``listing_json``) and reused
+    byte-for-byte; filtered listings are serialized on demand. So is a deduplicated
+    merged listing with each card once (see ``lookup`` with ``dedupe``) and
+    its summary projection (see ``lookup_summaries``).
+    """
+
+    def __init__(self, cards_by_category: Dict[str, List[Dict[str, Any]]], compact_json: bool = False):
+        self._cards_by_category = cards_by_category
+        self._index = self._build_index(cards_by_category)
+        self._merged_index = self._build_merged_index(self._index)
+        self._summary_index = self._build_summary_index(self._merged_index)
+        self.compact_json = compact_json
+        # Only the unfiltered listing is read on the hot path; the other 14 would cost ~140 KiB per worker
+        self._listing_json = {
+            UNFILTERED_KEY: self._serialize_listing(UNFILTERED_KEY, self._index[UNFILTERED_KEY], compact_json)
+        }
+
+    @staticmethod
+    def _build_index(cards_by_category: Dict[str, List[Dict[str, Any]]]) -> Dict[IndexKey, CardList]:
+        """Build posting lists for every (category, no_annual_fee) combination."""
+        fee_status = {
+            id(card): classify_annual_fee(card)
+            for cards in cards_by_category.values()
+            for card in cards
+        }
+
+        index: Dict[IndexKey, CardList] = {}
+        scopes: List[Tuple[Optional[str], List[Dict[str, Any]]]] = [
+            (None, [card for cards in cards_by_category.values() for card in cards])
+        ]
+        scopes.extend(cards_by_category.items())
+
+        for category, cards in scopes:
+            index[(category, None)] = tuple(cards)
+            for no_annual_fee in (True, False):
+                # Cards without fee information never match a fee filter
+                index[(category, no_annual_fee)] = tuple(
+                    card for card in cards if fee_status[id(card)] is no_annual_fee
+                )
+        return index
+
+    @staticmethod
+    def _build_merged_index(index: Dict[IndexKey, CardList]) -> Dict[IndexKey, CardList]:
+        """
+        Build deduplicated posting lists for every key of ``index``.
+
+        list_cards.json repeats a card under each category it belongs to. Here
+        those copies (matched by cleaned title, which identifies the card code
+        one-to-one) become one record with a ``categories`` list of every
+        category it appears in. ``category`` is the listing's category filter,
+        or the card's first category when unfiltered. Records are shared
+        between listings with the same category filter.
+        """
+        categories_by_card: Dict[str, List[str]] = {}
+        first_record: Dict[str, Dict[str, Any]] = {}
+        for card in index[(None, None)]:
+            identity = clean_card_title(card.get('title', ''))
+            categories_by_card.setdefault(identity, []).append(card['category'])
+            first_record.setdefault(identity, card)
+
+        merged: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        for identity, card in first_record.items():
+            categories = categories_by_card[identity]
+            merged[(identity, None)] = {**card, 'category': categories[0], 'categories': categories}
+            for category in categories:
+                merged[(identity, category)] = {**card, 'category': category, 'categories': categories}
+
+        merged_index: Dict[IndexKey, CardList] = {}
+        for (category, no_annual_fee), cards in index.items():
+            identities = dict.fromkeys(clean_card_title(card.get('title', '')) for card in cards)
+            merged_index[(category, no_annual_fee)] = tuple(merged[(identity, category)] for identity in identities)
+        return merged_index
+
+    @staticmethod
+    def _build_summary_index(merged_index: Dict[IndexKey, CardList]) -> Dict[IndexKey, CardList]:
+        """Project every deduplicated listing down to the fields the card list widget renders."""
+        summaries: Dict[int, Dict[str, Any]] = {}
+
+        def summarize(card: Dict[str, Any]) -> Dict[str, Any]:
+            summary = summaries.get(id(card))
+            if summary is None:
+                summary = {field: card.get(field, '') for field in SUMMARY_FIELDS}
+                for field in SUMMARY_FIRST_ITEM_FIELDS:
+                    summary[field] = (card.get(field) or [])[:1]
+                summary['category'] = card['category']
+                summary['categories'] = card['categories']
+                summaries[id(card)] = summary
+            return summary
+
+        return {key: tuple(summarize(card) for card in cards) for key, cards in merged_index.items()}
+
+    @staticmethod
+    def _serialize_listing(key: IndexKey, cards: CardList, compact: bool) -> str:
+        """Serialize one listing as ``{"message", "count", "cards"}`` JSON text."""
+        filter_desc = describe_filters(*key)
+        message = (
+            f"Successfully retrieved {len(cards)} Wells Fargo credit cards {filter_desc}."
+            if filter_desc else
+            f"Successfully retrieved all {len(cards)} Wells Fargo credit cards."
+        )
+        return dumps_json({"message": message, "count": len(cards), "cards": cards}, compact)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], categories: Iterable[str] = CARD_CATEGORIES, compact_json: bool = False) -> "CardCatalog":
+        """
+        Build a catalog from the parsed contents of list_cards.json.
+
+        Args:
+            data: Parsed list_cards.json document
+            categories: Categories to extract from ``componentObjects``
+            compact_json: Serialize listings without indentation
+
+        Returns:
+            CardCatalog holding the flattened records per category
+        """
+        component_objects = data.get('componentObjects', {})
+        cards_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        memo: Dict[Any, Any] = {}  # Shares a card's content between the categories listing it
+
+        for cat in categories:
+            items = component_objects.get(cat, [])
+            cards = []
+            for item in items:
+                try:
+                    content = share_json_values(item['content']['Component']['Content'], memo)
+                    cards.append({**content, 'category': cat})
+                except (KeyError, TypeError) as e:
+                    logger.debug(f"Skipping invalid item in category '{cat}': {str(e)}")
+                    continue
+            cards_by_category[cat] = cards
+
+        return cls(cards_by_category, compact_json)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Path = LIST_CARDS_PATH,
+        categories: Iterable[str] = CARD_CATEGORIES,
+        compact_json: bool = False,
+        strict: bool = False,
+    ) -> "CardCatalog":
+        """
+        Load a catalog from list_cards.json.
+
+        Missing or invalid files are logged and produce an empty catalog,
+        matching the previous per-call behaviour of ``list_cards``, unless
+        ``strict`` is set (used when reloading, to keep the current data).
+
+        Raises:
+            DataLoadError: If ``strict`` and the file is missing, invalid or holds no cards
+        """
+        logger.info(f"📚 Loading card catalog from {path}")
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            if strict:
+                raise DataLoadError(f"{path} not found")
+            logger.error(f"❌ {path} not found")
+            return cls({cat: [] for cat in categories}, compact_json)
+        except json.JSONDecodeError as e:
+            if strict:
+                raise DataLoadError(f"Invalid JSON in {path}: {str(e)}")
+            logger.error(f"❌ Error parsing {path}: {str(e)}")
+            return cls({cat: [] for cat in categories}, compact_json)
+
+        if strict and not isinstance(data, dict):
+            raise DataLoadError(f"Expected a JSON object in {path}")
+        catalog = cls.from_data(data, categories, compact_json)
+        if strict and catalog.size == 0:
+            raise DataLoadError(f"No cards found in {path}")
+        logger.info(f"✅ Card catalog loaded: {catalog.size} card record(s)")
+        return catalog
+
+    @property
+    def categories(self) -> List[str]:
+        """Categories held by this catalog, in listing order."""
+        return list(self._cards_by_category)
+
+    @property
+    def size(self) -> int:
+        """Total number of card records across all categories."""
+        return sum(len(cards) for cards in self._cards_by_category.values())
+
+    def lookup(self, category: Optional[str] = None, no_annual_fee: Optional[bool] = None, dedupe: bool = False) -> CardList:
+        """
+        Get the cached card records matching the given filters.
+
+        Args:
+            category: Category to include (all categories if None)
+            no_annual_fee: True for $0 annual fee cards, False for cards with a fee,
+                None for no fee filter
+            dedupe: List each card once, with a ``categories`` list, instead of
+                once per category it appears in
+
+        Returns:
+            Immutable, shared tuple of card records in category order
+            (empty for unknown categories)
+        """
+        index = self._merged_index if dedupe else self._index
+        return index.get((category, no_annual_fee), ())
+
+    def lookup_summaries(self, category: Optional[str] = None, no_annual_fee: Optional[bool] = None) -> CardList:
+        """
+        Get the summary projection of the cards matching the given filters.
+
+        Same cards as the deduplicated listing (see ``lookup`` with ``dedupe``),
+        keeping ``category``, ``categories`` and only the fields the card list
+        widget renders: title, subtitle, the first entry of the intro offer,
+        rewards and annual fee content.
+
+        Returns:
+            Immutable, shared tuple of summary records (empty for unknown categories)
+        """
+        return self._summary_index.get((category, no_annual_fee), ())
+
+    def listing_json(self, category: Optional[str] = None, no_annual_fee: Optional[bool] = None) -> str:
+        """
+        Get the JSON text for a listing.
+
+        The document is ``{"message", "count", "cards"}`` with the same cards
+        as ``lookup``; it is pretty-printed unless the catalog was built with
+        ``compact_json``. The unfiltered listing is precomputed; filtered
+        listings are serialized on each call.
+        """
+        key = (category, no_annual_fee)
+        text = self._listing_json.get(key)
+        if text is None:
+            text = self._serialize_listing(key, self._index.get(key, ()), self.compact_json)
+        return text
+
+
+def rates_and_fees_filename(clean_title: str) -> str:
+    """Get the rates and fees file name for a cleaned card title (e.g. "Active Cash" -> "active_cash.json")."""
+    return clean_title.lower().replace(' ', '_') + '.json'
+
+
+class RatesStore:
+    """
+    Rates and fees documents for every card, keyed by card code and cleaned title.
+
+    All documents are parsed when the store is loaded; lookups do no file I/O.
+    Equal values across documents are stored once (see ``share_json_values``).
+    Documents are shared between calls and must be treated as read-only.
+    """
+
+    def __init__(self, documents_by_code: Dict[str, Dict[str, Any]], titles_by_code: Mapping[str, str]):
+        self._documents_by_code = dict(documents_by_code)
+        # Keys are case-insensitive, matching the previous file-name based lookup
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        for code, document in documents_by_code.items():
+            self._documents[self._key(code)] = document
+            self._documents[self._key(titles_by_code[code])] = document
+        self._codes = tuple(documents_by_code)
+
+    @staticmethod
+    def _key(code_or_title: str) -> str:
+        return code_or_title.lower().replace(' ', '_')
+
+    @classmethod
+    def from_dir(cls, titles_by_code: Mapping[str, str], directory: Path = RATES_AND_FEES_DIR) -> "RatesStore":
+        """
+        Load the rates and fees document for every card.
+
+        Args:
+            titles_by_code: Mapping of card code to cleaned card title
+            directory: Directory holding one ``<title>.json`` file per card
+
+        Raises:
+            DataLoadError: If any card's file is missing or is not a valid JSON object
+        """
+        logger.info(f"💰 Loading rates and fees for {len(titles_by_code)} card(s) from {directory}")
+        documents: Dict[str, Dict[str, Any]] = {}
+        problems: List[str] = []
+        memo: Dict[Any, Any] = {}  # Shares labels and boilerplate between the cards' documents
+
+        for code, title in titles_by_code.items():
+            try:
+                documents[code] = cls.read_document(directory / rates_and_fees_filename(title), memo)
+            except DataLoadError as e:
+                problems.append(f"{title} ({code}): {e}")
+
+        if problems:
+            raise DataLoadError("Failed to load rates and fees:\n  " + "\n  ".join(problems))
+
+        logger.info(f"✅ Rates and fees loaded for {len(documents)} card(s)")
+        return cls(documents, titles_by_code)
+
+    @staticmethod
+    def read_document(path: Path, memo: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
+        """
+        Parse one card's rates and fees file (values shared via ``share_json_values``).
+
+        Raises:
+            DataLoadError: If the file is missing or is not a valid JSON object
+        """
+        try:
+            with open(path, 'r') as f:
+                document = json.load(f)
+        except FileNotFoundError:
+            raise DataLoadError(f"file not found: {path}")
+        except json.JSONDecodeError as e:
+            raise DataLoadError(f"invalid JSON in {path}: {str(e)}")
+
+        if not isinstance(document, dict):
+            raise DataLoadError(f"expected a JSON object in {path}")
+        return share_json_values(document, memo)
+
+    def replace(self, documents_by_code: Mapping[str, Dict[str, Any]], titles_by_code: Mapping[str, str]) -> "RatesStore":
+        """Get a new store with the given cards' documents replaced; this store is unchanged."""
+        return type(self)({**self._documents_by_code, **documents_by_code}, titles_by_code)
+
+    @property
+    def codes(self) -> Tuple[str, ...]:
+        """Card codes held by this store."""
+        return self._codes
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the rates and fees document for a card code or cleaned card title (case-insensitive)."""
+        return self._documents.get(self._key(key))
+
+
+# (benefit_name, fact key) of the rows a fact-table comparison shows, in display order
+COMPARISON_FACT_ROWS = (
+    ("Annual fee", "annual_fee"),
+    ("Intro APR", "intro_apr"),
+    ("Balance transfer fee", "balance_transfer_fee"),
+    ("Foreign transaction fees", "foreign_transaction_fee"),
+    ("Rewards rate", "rewards_rate"),
+)
+
+_LINE_BREAK_RE = re.compile(r'<br\b[^>]*>', re.IGNORECASE)
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_MONTHS_RE = re.compile(r'(\d+)\s+months')
+_DAYS_RE = re.compile(r'for\s+(\d+)\s+days')
+_MINIMUM_RE = re.compile(r'minimum of \$(\d+)|\$(\d+) or')
+
+
+def _fee_details(rates: Mapping[str, Any], *path: str) -> Optional[str]:
+    """Get a fee's ``details`` text from a rates and fees document, or None if absent."""
+    node: Any = rates.get('fees', {})
+    for key in path:
+        node = node.get(key) if isinstance(node, dict) else None
+    details = node.get('details') if isinstance(node, dict) else None
+    return details.strip() if isinstance(details, str) else None
+
+
+def _intro_apr(rates: Mapping[str, Any], section: str) -> Tuple[Optional[str], Optional[int]]:
+    """Get (rate, months) of an introductory APR, e.g. ("0%", 21), or (None, None)."""
+    intro = rates.get('interestRatesAndInterestCharges', {}).get(section, {}).get('introApr')
+    if not isinstance(intro, dict) or not intro.get('rate'):
+        return None, None
+    months = _MONTHS_RE.search(intro.get('duration', ''))
+    return intro['rate'], int(months.group(1)) if months else None
+
+
+def _normalize_balance_transfer_fee(details: Optional[str]) -> Optional[str]:
+    """
+    Shorten balance transfer fee terms, e.g. "Introductory fee of either $5 or 3% ...
+    for 120 days ... After that, up to 5% ..., with a minimum of $5." ->
+    "3% for 120 days, then up to 5% (min $5)". Unrecognized text is returned as-is.
+    """
+    if not details:
+        return None
+    percents = _PERCENT_RE.findall(details)
+    if not percents:
+        return details
+    minimum = _MINIMUM_RE.search(details)
+    minimum_text = f" (min ${minimum.group(1) or minimum.group(2)})" if minimum else ""
+    days = _DAYS_RE.search(details)
+    up_to = "up to " if "up to" in details.lower() else ""
+    if days and len(percents) > 1:
+        return f"{percents[0]}% for {days.group(1)} days, then {up_to}{percents[1]}%{minimum_text}"
+    return f"{up_to.capitalize()}{percents[0]}%{minimum_text}"
+
+
+def _normalize_foreign_transaction_fee(details: Optional[str]) -> Optional[str]:
+    """Shorten foreign transaction fee terms to "None" or the percentage, e.g. "3%"."""
+    if not details:
+        return None
+    if details.lower().rstrip('.') == 'none':
+        return "None"
+    percent = _PERCENT_RE.search(details)
+    return f"{percent.group(1)}%" if percent else details
+
+
+def _plain_lines(content: str) -> List[str]:
+    """Split card content markup into plain-text lines at ``<br>`` tags."""
+    text = html.unescape(_HTML_TAG_RE.sub('', _LINE_BREAK_RE.sub('\n', content)))
+    return [' '.join(line.split()) for line in text.splitlines() if line.strip()]
+
+
+@dataclass(frozen=True, slots=True)
+class CardFacts:
+    """One card's normalized comparison facts (strings are interned)."""
+    code: str
+    annual_fee: Optional[str]
+    intro_apr: str
+    intro_apr_months: Optional[int]
+    balance_transfer_fee: Optional[str]
+    foreign_transaction_fee: Optional[str]
+    rewards_rate: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _intern(text: Optional[str]) -> Optional[str]:
+    return sys.intern(text) if text is not None else None
+
+
+class ComparisonFacts:
+    """
+    Normalized comparison facts for every card, keyed by canonical card title.
+
+    Extracted once from the catalog's card records and the rates and fees
+    documents: annual fee, intro APR (and its months), balance transfer fee,
+    foreign transaction fee and rewards rate. Lets a comparison be assembled
+    without fetching (or reading) the full benefits and rates payloads.
+    """
+
+    def __init__(self, facts_by_title: Dict[str, CardFacts]):
+        self._facts = facts_by_title
+
+    @classmethod
+    def build(
+        cls,
+        titles_by_code: Mapping[str, str],
+        cards_by_title: Mapping[str, Dict[str, Any]],
+        rates_store: "RatesStore",
+    ) -> "ComparisonFacts":
+        """
+        Extract the facts for every card.
+
+        Args:
+            titles_by_code: Mapping of card code to canonical (cleaned) card title
+            cards_by_title: Catalog card records keyed by cleaned card title
+            rates_store: Rates and fees documents for every card
+        """
+        facts: Dict[str, CardFacts] = {}
+        for code, title in titles_by_code.items():
+            card = cards_by_title.get(title, {})
+            rates = rates_store.get(code) or {}
+
+            annual_fee = _fee_details(rates, 'annualFee')
+            if annual_fee is not None and annual_fee.lower() == 'none':
+                annual_fee = "$0"
+            elif annual_fee is None:
+                fee_content = card.get('feature6_content') or []
+                annual_fee = fee_content[0].strip() if fee_content else None
+
+            purchase_rate, purchase_months = _intro_apr(rates, 'aprForPurchases')
+            transfer_rate, transfer_months = _intro_apr(rates, 'aprForBalanceTransfers')
+            if purchase_rate and (transfer_rate, transfer_months) == (purchase_rate, purchase_months):
+                intro_apr = f"{purchase_rate} intro APR for {purchase_months} months on purchases and balance transfers"
+            elif purchase_rate:
+                intro_apr = f"{purchase_rate} intro APR for {purchase_months} months on purchases"
+            elif transfer_rate:
+                intro_apr = f"{transfer_rate} intro APR for {transfer_months} months on balance transfers"
+            else:
+                intro_apr = "None"
+
+            rewards_content = card.get('feature5_content') or []
+            rewards_lines = _plain_lines(rewards_content[0]) if rewards_content else []
+
+            facts[title] = CardFacts(
+                code=sys.intern(code),
+                annual_fee=_intern(annual_fee),
+                intro_apr=sys.intern(intro_apr),
+                intro_apr_months=purchase_months or transfer_months,
+                balance_transfer_fee=_intern(_normalize_balance_transfer_fee(
+                    _fee_details(rates, 'transactionFees', 'balanceTransfers'))),
+                foreign_transaction_fee=_intern(_normalize_foreign_transaction_fee(
+                    _fee_details(rates, 'transactionFees', 'foreignTransaction'))),
+                rewards_rate=sys.intern("; ".join(rewards_lines) if rewards_lines else "None"),
+            )
+
+        logger.info(f"📊 Comparison facts built for {len(facts)} card(s)")
+        return cls(facts)
+
+    def get(self, title: str) -> Optional[CardFacts]:
+        """Get the facts for a canonical card title."""
+        return self._facts.get(title)
+
+    def benefit_rows(self, titles: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Build compare_credit_cards ``benefit_rows`` for canonical card titles.
+
+        Unknown facts are shown as "Not available".
+        """
+        facts = [(title, self._facts.get(title)) for title in titles]
+        return [
+            {
+                "benefit_name": benefit_name,
+                "card_values": {
+                    title: (getattr(card_facts, key) if card_facts is not None else None) or "Not available"
+                    for title, card_facts in facts
+                },
+            }
+            for benefit_name, key in COMPARISON_FACT_ROWS
+        ]
+
@@ -0,0 +1,153 @@
+"""
+Upstream circuit breaking for Credit Card Finder MCP Server.
+Tracks per-host latency and failures, opens after consecutive failures or slow calls,
+and derives request timeouts from observed p99 latency.
+"""
+
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one upstream host.
+
+    Starts closed. ``failure_threshold`` consecutive failures (a call slower
+    than ``slow_call_seconds`` counts as a failure) open it, and ``allow``
+    then returns False so callers fail fast. After ``reset_timeout`` seconds
+    one probe call is let through (half-open): success closes the breaker,
+    failure opens it again. Only the event loop thread may use the breaker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        slow_call_seconds: float,
+        default_timeout: float,
+        min_timeout: float,
+        timeout_multiplier: float = 2.0,
+        window: int = 200,
+        min_samples: int = 20,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.min_samples = min_samples
+        self._timer = timer
+        self._latencies: Deque[float] = deque(maxlen=window)
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # Counters for /health
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def closed(self) -> bool:
+        """True while calls flow freely; unlike ``allow`` this changes no state."""
+        return self.state == CLOSED
+
+    def allow(self) -> bool:
+        """Return True if a call may be made now, False to fail fast."""
+        if self.state == OPEN:
+            if self._timer() - self._opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = HALF_OPEN
+            logger.info("🔌 Circuit for %s half-open, probing upstream", self.name)
+
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self, latency: float) -> None:
+        """Record a completed call; calls slower than ``slow_call_seconds`` count as failures."""
+        self._latencies.append(latency)
+        if latency > self.slow_call_seconds:
+            self.record_failure()
+            return
+
+        self.successes += 1
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+        if self.state != CLOSED:
+            self.state = CLOSED
+            logger.info("🔌 Circuit for %s closed", self.name)
+
+    def record_failure(self) -> None:
+        """Record a failed (or slow) call, opening the breaker if the threshold is reached."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+            self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = self._timer()
+        self.times_opened += 1
+        logger.warning(
+            "🔌 Circuit for %s opened after %d consecutive failure(s); failing fast for %gs",
+            self.name, self.consecutive_failures, self.reset_timeout,
+        )
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Observed latency percentile (0 < q <= 1) in seconds, or None without samples."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    def timeout(self) -> float:
+        """
+        Request timeout derived from observed p99 latency.
+
+        Returns ``default_timeout`` until ``min_samples`` calls have been seen,
+        then ``p99 * timeout_multiplier`` clamped to [min_timeout, default_timeout].
+        """
+        if len(self._latencies) < self.min_samples:
+            return self.default_timeout
+        p99 = self.percentile(0.99)
+        return min(self.default_timeout, max(self.min_timeout, p99 * self.timeout_multiplier))
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and latency figures."""
+        p50 = self.percentile(0.5)
+        p99 = self.percentile(0.99)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "successes": self.successes,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+            "latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "latency_p99_ms": round(p99 * 1000, 1) if p99 is not None else None,
+            "timeout_seconds": round(self.timeout(), 3),
+        }
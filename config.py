@@ -2,6 +2,9 @@
 Configuration constants for Credit Card Finder MCP Server.
 """
 
+import logging
+import os
+
 # Server configuration
 SERVER_NAME = "credit_card_finder"
 SERVER_VERSION = "1.0.0"
@@ -12,6 +15,12 @@ SERVER_DESCRIPTION = (
 SERVER_HOST = "0.0.0.0"
 SERVER_PORT = 8000
 
+# Logging configuration (DEBUG, INFO, WARNING, ERROR); unknown values fall back to INFO
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    logging.getLogger(__name__).warning("⚠️  Unknown LOG_LEVEL %r, using INFO", LOG_LEVEL)
+    LOG_LEVEL = "INFO"
+
 # MCP configuration
 MCP_INSTRUCTIONS = (
     "You are an informational assistant that provides factual comparisons of Wells Fargo credit card products. "
@@ -36,7 +45,11 @@ MCP_INSTRUCTIONS = (
     "  **Step 3**: Analyze the data from steps 1 & 2, then call 'compare_credit_cards' to display the information\n"
     "              Format the comparison with benefit_rows showing same features across cards\n"
     "              Include a recommended_card based on factual analysis\n\n"
-    "**NEVER skip steps 1 or 2**. Both data-fetching steps are MANDATORY before displaying comparison.\n\n"
+    "**NEVER skip steps 1 or 2** when writing benefit_rows yourself. Both data-fetching steps are MANDATORY before displaying such a comparison.\n\n"
+
+    "**Fact-table comparisons:** For a comparison of annual fee, intro APR, balance transfer fee, foreign transaction fees "
+    "and rewards rate, call 'compare_credit_cards' directly with cards and recommended_card and omit benefit_rows; "
+    "the server fills them in from its card fact table, so steps 1 and 2 can be skipped.\n\n"
 
     "**Common Comparison Triggers** (always use 3-step workflow):\n"
     "• \"compare cards\" or \"compare these cards\"\n"
@@ -88,6 +101,51 @@ MCP_INSTRUCTIONS = (
     "• Base any suggestions on factual comparison of features and terms"
 )
 
+# Serialize precomputed card listings without indentation (smaller payloads)
+COMPACT_JSON = os.getenv("COMPACT_JSON", "false").lower() in ("1", "true", "yes")
+
+# Seconds between checks of json/list_cards.json and json/rates_and_fees for changes; 0 disables hot reload
+CARD_DATA_RELOAD_SECONDS = float(os.getenv("CARD_DATA_RELOAD_SECONDS", "5"))
+
+# Public URL of this server (e.g. an ngrok tunnel), used by widgets for API calls and card images
+PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "").rstrip("/")
+
+# Upstream Wells Fargo configuration
+UPSTREAM_BASE_URL = os.getenv("UPSTREAM_BASE_URL", "https://web.secure.wellsfargo.com")
+UPSTREAM_TIMEOUT_SECONDS = 10.0       # Per-request timeout
+UPSTREAM_DEADLINE_SECONDS = 15.0      # Overall deadline for one multi-card fetch
+UPSTREAM_MAX_CONNECTIONS = 10         # Connection pool limit for the upstream host
+UPSTREAM_KEEPALIVE_EXPIRY_SECONDS = 30.0
+UPSTREAM_MAX_TRIES = int(os.getenv("UPSTREAM_MAX_TRIES", "3"))  # Attempts per card, with jittered exponential backoff
+UPSTREAM_RETRY_BACKOFF_SECONDS = 0.2  # Base delay between attempts
+UPSTREAM_MIN_TIMEOUT_SECONDS = 1.0    # Floor for the p99-derived per-request timeout
+UPSTREAM_TIMEOUT_P99_MULTIPLIER = 2.0  # Per-request timeout = observed p99 x this (capped at UPSTREAM_TIMEOUT_SECONDS)
+
+# Per-host circuit breaker for upstream requests
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))  # Consecutive failures (or slow calls) that open it
+CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))       # Time open before a probe request is allowed
+CIRCUIT_SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "5"))  # Calls slower than this count as failures
+
+# Benefit-terms response cache (keyed by card code)
+BENEFITS_CACHE_TTL_SECONDS = float(os.getenv("BENEFITS_CACHE_TTL_SECONDS", "3600"))
+BENEFITS_CACHE_MAX_STALE_SECONDS = float(os.getenv("BENEFITS_CACHE_MAX_STALE_SECONDS", "86400"))
+BENEFITS_CACHE_MAX_SIZE = int(os.getenv("BENEFITS_CACHE_MAX_SIZE", "64"))
+
+# Benefit-terms snapshot (json/benefit_terms/<code>.json): served before any upstream request
+BENEFITS_SNAPSHOT_ENABLED = os.getenv("BENEFITS_SNAPSHOT_ENABLED", "true").lower() in ("1", "true", "yes")
+# Snapshots older than this are refreshed in the background; 0 disables the refresher
+BENEFITS_SNAPSHOT_REFRESH_SECONDS = float(os.getenv("BENEFITS_SNAPSHOT_REFRESH_SECONDS", "21600"))
+# Snapshots younger than this are served as is; older ones are served stale (for up to
+# BENEFITS_CACHE_MAX_STALE_SECONDS more) while a request refreshes them, then no longer served
+BENEFITS_SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("BENEFITS_SNAPSHOT_MAX_AGE_SECONDS", "43200"))
+
+# Opt-in request profiling (see profiling.py); can also be toggled at runtime via /debug/profiling
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0.01"))  # Fraction of requests profiled
+PROFILING_DIR = os.getenv("PROFILING_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+# Bearer token required to change profiling at runtime; unset disables the toggle
+PROFILING_ADMIN_TOKEN = os.getenv("PROFILING_ADMIN_TOKEN", "")
+
 SSE_PATH = "/mcp"
 MESSAGE_PATH = "/mcp/messages"
 
@@ -0,0 +1,41 @@
+"""
+Gunicorn configuration for the multi-worker production launch mode.
+
+To run:
+    gunicorn -c gunicorn.conf.py server:app
+
+The app is imported once in the master before workers are forked
+(preload_app), so the card catalog, rates and fees store, title resolver
+and rendered widget HTML are built a single time and shared copy-on-write
+by every worker. Per-process state such as the upstream HTTP client is
+created lazily inside each worker.
+"""
+
+import gc
+import os
+
+from config import LOG_LEVEL, SERVER_HOST, SERVER_PORT
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects container CPU affinity)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = f"{os.getenv('SERVER_HOST', SERVER_HOST)}:{os.getenv('SERVER_PORT', SERVER_PORT)}"
+workers = int(os.getenv("WEB_CONCURRENCY", _available_cpus()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+loglevel = LOG_LEVEL.lower()
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+
+def when_ready(server):
+    # Everything built during preload is long-lived; move it out of the GC's
+    # tracked generations so collections in workers don't touch (and copy) those pages
+    gc.freeze()
@@ -10,50 +10,28 @@ This module contains all MCP callback handlers:
 """
 
 import logging
-import sys
-from typing import List, Sequence, cast
+from typing import List, cast
 
 import mcp.types as types
 from pydantic import AnyUrl
-from tools import handle_tool_call, get_tool_definitions
+from metrics import RESOURCE_READ_BYTES
+from profiling import profiler
+from tools import handle_tool_call, get_list_tools_result
 from widgets import widgets, _tool_meta, _resource_description, WIDGETS_BY_URI, MIME_TYPE
 
-# Setup logging with force to override any previous configuration
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(levelname)s:%(name)s: %(message)s',
-    stream=sys.stdout,
-    force=True  # This forces reconfiguration
-)
+# Logging is configured by server.py (LOG_LEVEL); handlers only log lazily
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Ensure this logger is at DEBUG level
 
-# Also set the root logger to DEBUG
-logging.getLogger().setLevel(logging.DEBUG)
 
-
-async def list_tools_handler() -> List[types.Tool]:
-    """Register all available credit card tools."""
-    logger.info("📋 list_tools_handler called")
-    tools = get_tool_definitions()
-    logger.info(f"   Returning {len(tools)} tools")
-    return tools
+async def list_tools_handler(req: types.ListToolsRequest) -> types.ServerResult:
+    """Register all available credit card tools (cached ListToolsResult)."""
+    result = get_list_tools_result()
+    logger.info("📋 list_tools_handler: returning %d tools", len(result.root.tools))
+    return result
 
 
 async def list_resources_handler() -> List[types.Resource]:
     """Register UI components as resources."""
-    # Use stderr for immediate output (not buffered by uvicorn)
-    sys.stderr.write("\n" + "=" * 80 + "\n")
-    sys.stderr.write("📦 CREDIT CARD FINDER: list_resources_handler called\n")
-    sys.stderr.write(f"   Registering {len(widgets)} widget(s) as resources\n")
-    sys.stderr.write("=" * 80 + "\n\n")
-    sys.stderr.flush()
-    
-    logger.info("=" * 80)
-    logger.info("📦 list_resources_handler called")
-    logger.info(f"   Total widgets available: {len(widgets)}")
-    
-    logger.debug("   Building resource registrations...")
     resources = [
         types.Resource(
             name=widget.title,
@@ -66,34 +44,18 @@ async def list_resources_handler() -> List[types.Resource]:
         for widget in widgets
     ]
     
-    logger.info(f"   ✅ Successfully created {len(resources)} resource registrations")
-    logger.info("   Resource Details:")
-    for i, resource in enumerate(resources, 1):
-        logger.info(f"      [{i}] Name: {resource.name}")
-        logger.debug(f"          URI: {resource.uri}")
-        logger.debug(f"          MimeType: {resource.mimeType}")
-        logger.debug(f"          Description: {resource.description}")
-        logger.debug(f"          Meta: {resource.meta}")
+    logger.info("📦 list_resources_handler: returning %d resource registrations", len(resources))
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, resource in enumerate(resources, 1):
+            logger.debug("   [%d] Name: %s URI: %s MimeType: %s", i, resource.name, resource.uri, resource.mimeType)
+            logger.debug("       Description: %s", resource.description)
+            logger.debug("       Meta: %s", resource.meta)
     
-    logger.info("📦 list_resources_handler completed")
-    logger.info("=" * 80)
     return resources
 
 
 async def list_resource_templates_handler() -> List[types.ResourceTemplate]:
     """Register resource templates following Pizzaz pattern."""
-    # Use stderr for immediate output (not buffered by uvicorn)
-    sys.stderr.write("\n" + "=" * 80 + "\n")
-    sys.stderr.write("🎨 CREDIT CARD FINDER: list_resource_templates_handler called\n")
-    sys.stderr.write(f"   Registering {len(widgets)} widget template(s)\n")
-    sys.stderr.write("=" * 80 + "\n\n")
-    sys.stderr.flush()
-    
-    logger.info("=" * 80)
-    logger.info("🎨 list_resource_templates_handler called")
-    logger.info(f"   Total widgets available for templates: {len(widgets)}")
-    
-    logger.debug("   Building resource template registrations...")
     templates = [
         types.ResourceTemplate(
             name=widget.title,
@@ -106,58 +68,29 @@ async def list_resource_templates_handler() -> List[types.ResourceTemplate]:
         for widget in widgets
     ]
     
-    logger.info(f"   ✅ Successfully created {len(templates)} resource template registrations")
-    logger.info("   Resource Template Details:")
-    for i, template in enumerate(templates, 1):
-        logger.info(f"      [{i}] Name: {template.name}")
-        logger.debug(f"          Title: {template.title}")
-        logger.debug(f"          URI Template: {template.uriTemplate}")
-        logger.debug(f"          MimeType: {template.mimeType}")
-        logger.debug(f"          Description: {template.description}")
-        logger.debug(f"          Meta Keys: {list(template.meta.keys()) if template.meta else 'None'}")
-        if template.meta:
-            for key, value in template.meta.items():
-                logger.debug(f"             - {key}: {value}")
+    logger.info("🎨 list_resource_templates_handler: returning %d resource template registrations", len(templates))
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, template in enumerate(templates, 1):
+            logger.debug("   [%d] Name: %s URI Template: %s MimeType: %s", i, template.name, template.uriTemplate, template.mimeType)
+            logger.debug("       Description: %s", template.description)
+            logger.debug("       Meta: %s", template.meta)
     
-    logger.info("🎨 list_resource_templates_handler completed")
-    logger.info("=" * 80)
     return templates
 
 
 async def read_resource_handler(req: types.ReadResourceRequest) -> types.ServerResult:
-    """Serve UI components as resources."""
-    # Use stderr for immediate output (not buffered by uvicorn)
-    sys.stderr.write("\n" + "=" * 80 + "\n")
-    sys.stderr.write("📖 CREDIT CARD FINDER: read_resource_handler called\n")
-    sys.stderr.write(f"   Requested URI: {req.params.uri}\n")
-    sys.stderr.write("=" * 80 + "\n")
-    sys.stderr.flush()
-    
-    logger.info("=" * 80)
-    logger.info(f"📖 read_resource_handler called")
-    logger.info(f"   Requested URI: {req.params.uri}")
-    logger.debug(f"   Request type: {type(req).__name__}")
-    logger.debug(f"   Request params: {req.params}")
-    logger.debug(f"   Total available widget URIs: {len(WIDGETS_BY_URI)}")
-    logger.debug(f"   Available widget URIs: {list(WIDGETS_BY_URI.keys())}")
-    
-    # Convert URI to string and look up widget
+    """Serve UI components as resources (a sample is profiled when profiling is enabled)."""
+    if profiler.enabled:
+        return await profiler.run("resource", str(req.params.uri), {}, _read_resource(req))
+    return await _read_resource(req)
+
+
+async def _read_resource(req: types.ReadResourceRequest) -> types.ServerResult:
     uri_str = str(req.params.uri)
-    logger.debug(f"   Looking up widget for URI string: '{uri_str}'")
     widget = WIDGETS_BY_URI.get(uri_str)
     
     if widget is None:
-        sys.stderr.write("❌ CREDIT CARD FINDER: Widget NOT FOUND!\n")
-        sys.stderr.write(f"   Requested: {uri_str}\n")
-        sys.stderr.write(f"   Available: {list(WIDGETS_BY_URI.keys())}\n")
-        sys.stderr.write("=" * 80 + "\n\n")
-        sys.stderr.flush()
-        
-        logger.error("❌ Widget not found!")
-        logger.error(f"   Requested URI: {uri_str}")
-        logger.error(f"   URI type: {type(req.params.uri)}")
-        logger.error(f"   Available URIs: {list(WIDGETS_BY_URI.keys())}")
-        logger.info("=" * 80)
+        logger.error("❌ read_resource_handler: widget not found for URI %s (available: %s)", uri_str, list(WIDGETS_BY_URI))
         return types.ServerResult(
             types.ReadResourceResult(
                 contents=[],
@@ -165,32 +98,10 @@ async def read_resource_handler(req: types.ReadResourceRequest) -> types.ServerR
             )
         )
 
-    sys.stderr.write(f"✅ CREDIT CARD FINDER: Widget FOUND - {widget.title}\n")
-    sys.stderr.write(f"   Widget ID: {widget.identifier}\n")
-    sys.stderr.write("📤 CREDIT CARD FINDER: Loading widget HTML (lazy-load)...\n")
+    # HTML is built once per bundle and served from memory
+    rendered = widget.render()
+    widget_html = rendered.html
     
-    # Lazy-load the HTML content
-    widget_html = widget.get_html()
-    
-    sys.stderr.write(f"   HTML Size: {len(widget_html)} chars\n")
-    root_id_search = f'id="{widget.root_id}"'
-    has_root_div = 'YES' if root_id_search in widget_html else 'NO'
-    sys.stderr.write(f"   Has root div: {has_root_div}\n")
-    sys.stderr.write("📤 CREDIT CARD FINDER: Sending widget HTML to ChatGPT...\n")
-    sys.stderr.write("=" * 80 + "\n\n")
-    sys.stderr.flush()
-    
-    logger.info(f"✅ Widget found successfully!")
-    logger.info(f"   Widget Title: {widget.title}")
-    logger.info(f"   Widget Identifier: {widget.identifier}")
-    logger.debug(f"   Widget Template URI: {widget.template_uri}")
-    logger.debug(f"   Lazy-loading widget HTML...")
-    logger.debug(f"   Widget HTML length: {len(widget_html)} characters")
-    logger.debug(f"   Widget HTML preview (first 200 chars):")
-    logger.debug(f"   {widget_html[:200]}...")
-    
-    # Build response contents
-    logger.debug("   Building TextResourceContents...")
     text_content = types.TextResourceContents(
         uri=AnyUrl(widget.template_uri),
         mimeType=MIME_TYPE,
@@ -202,14 +113,11 @@ async def read_resource_handler(req: types.ReadResourceRequest) -> types.ServerR
         [text_content]
     )
     
-    logger.info(f"📤 Sending resource content")
-    logger.info(f"   Content for widget: {widget.title}")
-    logger.debug(f"   Content URI: {widget.template_uri}")
-    logger.debug(f"   Content mimeType: {MIME_TYPE}")
-    logger.debug(f"   Content text length: {len(widget_html)} bytes")
-    logger.debug(f"   Content meta: {_tool_meta(widget)}")
-    logger.info("📖 read_resource_handler completed successfully")
-    logger.info("=" * 80)
+    RESOURCE_READ_BYTES.observe(len(rendered.body), uri_str)
+    logger.info("📖 read_resource_handler: serving %s (%d chars)", widget.identifier, len(widget_html))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("   Has root div: %s", f'id="{widget.root_id}"' in widget_html)
+        logger.debug("   HTML preview (first 200 chars): %s...", widget_html[:200])
 
     return types.ServerResult(types.ReadResourceResult(contents=contents))
 
@@ -229,10 +137,10 @@ def register_mcp_handlers(mcp_server):
     logger.info("🔧 Registering MCP handlers...")
     
     # Register tools handlers
+    # The tool list is static, so it is built here once and the same result is served to every request
     logger.debug("   Registering list_tools handler...")
-    @mcp_server._mcp_server.list_tools()
-    async def _list_tools() -> List[types.Tool]:
-        return await list_tools_handler()
+    get_list_tools_result()
+    mcp_server._mcp_server.request_handlers[types.ListToolsRequest] = list_tools_handler
     logger.debug("   ✅ list_tools handler registered")
     
     # Register resources handlers
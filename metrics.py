@@ -0,0 +1,161 @@
+"""
+Request metrics for Credit Card Finder MCP Server.
+Counters and histograms rendered in the Prometheus text exposition format by the /metrics route.
+
+Metrics are updated from the event loop thread only, so plain dict updates
+are enough (no locks on the hot path). Under gunicorn each worker keeps and
+reports its own values.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+# Latency buckets in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Payload size buckets in bytes
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        """Sample lines for this metric, without HELP and TYPE."""
+
+    def collect(self) -> Iterator[str]:
+        """Exposition lines for this metric, including HELP and TYPE."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        yield from self._samples()
+
+
+class Counter(_Metric):
+    """Monotonic counter with optional labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def _samples(self) -> Iterator[str]:
+        for labelvalues, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram with optional labels."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (non-cumulative) ..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        series = self._values.get(labelvalues)
+        if series is None:
+            series = self._values[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._values.get(labelvalues)
+        return int(sum(series[:-1])) if series else 0
+
+    def _samples(self) -> Iterator[str]:
+        bucket_names = self.labelnames + ("le",)
+        for labelvalues, series in sorted(self._values.items()):
+            cumulative = 0
+            for upper, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(bucket_names, labelvalues + (_format_value(upper),))} {cumulative}"
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {_format_value(series[-1])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class CallbackMetric(_Metric):
+    """
+    Metric whose samples are read from existing state at scrape time.
+
+    ``callback`` returns a mapping of label values to the current value, so
+    counters already kept elsewhere (e.g. cache stats) cost nothing per request.
+    """
+
+    def __init__(self, name: str, documentation: str, type_name: str, callback: Callable[[], Mapping[LabelValues, float]], labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.type_name = type_name
+        self._callback = callback
+
+    def _samples(self) -> Iterator[str]:
+        for labelvalues, value in sorted(self._callback().items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"
+
+
+class Registry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: Iterable[str] = (line for metric in self._metrics.values() for line in metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+TOOL_CALLS = REGISTRY.register(Counter(
+    "mcp_tool_calls_total", "MCP tool calls by tool name.", ("tool",)))
+TOOL_ERRORS = REGISTRY.register(Counter(
+    "mcp_tool_errors_total", "MCP tool calls that returned an error result or raised.", ("tool",)))
+TOOL_LATENCY = REGISTRY.register(Histogram(
+    "mcp_tool_latency_seconds", "MCP tool call latency.", ("tool",)))
+RESOURCE_READ_BYTES = REGISTRY.register(Histogram(
+    "mcp_resource_read_bytes", "Size of resource contents served by resources/read.", ("uri",), buckets=SIZE_BUCKETS))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "upstream_benefits_fetch_seconds", "Upstream benefit-terms fetch latency per card code, including retries.", ("card_code", "outcome")))
+BENEFITS_SNAPSHOT_HITS = REGISTRY.register(Counter(
+    "benefits_snapshot_hits_total", "Benefit-terms lookups served from the on-disk snapshot.", ("card_code",)))
@@ -0,0 +1,162 @@
+"""
+Opt-in sampling profiler for Credit Card Finder MCP Server.
+
+Profiles a random fraction of tool calls and resource reads and writes one
+profile per sampled request to PROFILING_DIR, next to a JSON sidecar with the
+tool (or resource) name, arguments and duration:
+
+- pyinstrument (when installed): ``.speedscope.json``, a flame graph that
+  opens in https://www.speedscope.app. Async mode attributes awaited time
+  to the profiled request only.
+- otherwise cProfile: ``.prof`` (pstats), viewable as a flame graph with
+  snakeviz or flameprof. cProfile sees every task that runs on the event
+  loop while the request is awaited, so concurrent requests show up too.
+
+At most one request is profiled at a time. When profiling is off, the only
+cost per request is a check of ``profiler.enabled``.
+"""
+
+import cProfile
+import hashlib
+import json
+import logging
+import random
+import re
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from config import PROFILING_DIR, PROFILING_ENABLED, PROFILING_SAMPLE_RATE
+
+# pyinstrument is optional; cProfile is used when it isn't installed
+try:
+    import pyinstrument
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:
+    pyinstrument = None
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+class Profiler:
+    """Samples requests for profiling; toggled by env var or the /debug/profiling route."""
+
+    def __init__(self, output_dir: Path, enabled: bool = False, sample_rate: float = 0.01):
+        self.output_dir = Path(output_dir)
+        self.enabled = False
+        self.sample_rate = 0.0
+        self.written = 0
+        self._active = False
+        self.configure(enabled=enabled, sample_rate=sample_rate)
+
+    @property
+    def backend(self) -> str:
+        return "pyinstrument" if pyinstrument is not None else "cProfile"
+
+    def configure(self, enabled: Optional[bool] = None, sample_rate: Optional[float] = None) -> None:
+        """
+        Turn profiling on or off and/or change the sampled fraction of requests.
+
+        Raises:
+            ValueError: If sample_rate is outside [0, 1]
+        """
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+            self.sample_rate = sample_rate
+        if enabled is not None:
+            self.enabled = enabled
+        logger.info("🔬 Profiling %s (sample rate %.3g, %s)", "enabled" if self.enabled else "disabled", self.sample_rate, self.backend)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "backend": self.backend,
+            "output_dir": str(self.output_dir),
+            "profiles_written": self.written,
+        }
+
+    async def run(self, kind: str, name: str, arguments: Dict[str, Any], awaitable: Awaitable[T]) -> T:
+        """
+        Await ``awaitable``, profiling it if this request is sampled.
+
+        Callers check ``profiler.enabled`` first so the disabled path never
+        gets here.
+
+        Args:
+            kind: Request kind used in the file name ("tool" or "resource")
+            name: Tool name or resource URI
+            arguments: Request arguments, written to the sidecar
+            awaitable: The request handler's coroutine
+        """
+        if self._active or random.random() >= self.sample_rate:
+            return await awaitable
+
+        self._active = True
+        start = time.perf_counter()
+        session = _start_session()
+        try:
+            return await awaitable
+        finally:
+            duration = time.perf_counter() - start
+            _stop_session(session)
+            self._active = False
+            try:
+                self._write(session, kind, name, arguments, duration)
+            except OSError as e:
+                logger.warning("⚠️  Could not write profile for %s %s: %s", kind, name, e)
+
+    def _write(self, session, kind: str, name: str, arguments: Dict[str, Any], duration: float) -> None:
+        arguments_json = json.dumps(arguments, sort_keys=True, default=str)
+        stem = "{}-{}-{}-{}".format(
+            time.strftime("%Y%m%dT%H%M%S"),
+            kind,
+            _UNSAFE_FILENAME_RE.sub("_", name)[:64],
+            hashlib.sha256(arguments_json.encode()).hexdigest()[:8],
+        )
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        if pyinstrument is not None:
+            profile_path = self.output_dir / f"{stem}.speedscope.json"
+            profile_path.write_text(SpeedscopeRenderer().render(session.last_session), encoding="utf-8")
+        else:
+            profile_path = self.output_dir / f"{stem}.prof"
+            session.dump_stats(profile_path)
+
+        sidecar = {
+            "kind": kind,
+            "name": name,
+            "arguments": json.loads(arguments_json),
+            "duration_ms": round(duration * 1000, 3),
+            "backend": self.backend,
+            "profile": profile_path.name,
+        }
+        (self.output_dir / f"{stem}.json").write_text(json.dumps(sidecar, indent=2), encoding="utf-8")
+        self.written += 1
+        logger.info("🔬 Wrote profile %s (%.1f ms)", profile_path.name, duration * 1000)
+
+
+def _start_session():
+    if pyinstrument is not None:
+        session = pyinstrument.Profiler(interval=0.0005, async_mode="enabled")
+        session.start()
+    else:
+        session = cProfile.Profile()
+        session.enable()
+    return session
+
+
+def _stop_session(session) -> None:
+    if pyinstrument is not None:
+        session.stop()
+    else:
+        session.disable()
+
+
+profiler = Profiler(PROFILING_DIR, enabled=PROFILING_ENABLED, sample_rate=PROFILING_SAMPLE_RATE)
@@ -2,12 +2,18 @@
 HTTP routes for Credit Card Finder MCP Server.
 """
 
-from starlette.responses import JSONResponse
+import secrets
+
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 from starlette.routing import Route
 
-from config import SERVER_NAME, SERVER_VERSION, SERVER_DESCRIPTION, TOOL_NAMES
-from widgets import widgets, HAS_UI, WIDGETS_BY_URI, MIME_TYPE
-from service import fetch_reward_benefits, fetch_rates_and_fees
+from config import SERVER_NAME, SERVER_VERSION, SERVER_DESCRIPTION, TOOL_NAMES, PROFILING_ADMIN_TOKEN
+from widgets import widgets, HAS_UI, WIDGETS_BY_ID, WIDGETS_BY_URI, MIME_TYPE
+from assets import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, get_card_images
+from circuit_breaker import CLOSED
+from metrics import REGISTRY
+from profiling import profiler
+from service import fetch_reward_benefits_async, fetch_rates_and_fees, fetch_card_details, benefits_cache, benefits_flights, circuit_breaker_stats, get_card_data
 
 
 async def root(request):
@@ -22,17 +28,27 @@ async def root(request):
             "mcp_messages": "/mcp/messages (HTTP POST - for stateless MCP)",
             "health": "/health",
             "info": "/info",
-            "widgets": "/debug/widgets"
+            "widgets": "/debug/widgets",
+            "cache": "/debug/cache"
         },
         "note": "The /mcp endpoint requires 'Accept: text/event-stream' header and is meant for MCP clients (like Claude Desktop), not browsers."
     })
 
 
 async def health(request):
-    """Health check endpoint."""
+    """
+    Health check endpoint.
+    
+    Includes the circuit breaker state per upstream host. Status is "degraded"
+    while any breaker is not closed; the server itself still answers (HTTP 200),
+    serving snapshot or cached benefits where it can.
+    """
+    upstream = circuit_breaker_stats()
+    degraded = any(stats["state"] != CLOSED for stats in upstream.values())
     return JSONResponse({
-        "status": "healthy",
-        "server": SERVER_NAME
+        "status": "degraded" if degraded else "healthy",
+        "server": SERVER_NAME,
+        "upstream": upstream
     })
 
 
@@ -43,7 +59,8 @@ async def server_info(request):
         "version": SERVER_VERSION,
         "description": SERVER_DESCRIPTION,
         "tools": len(TOOL_NAMES),
-        "tool_list": TOOL_NAMES
+        "tool_list": TOOL_NAMES,
+        "card_data": get_card_data().info()
     })
 
 
@@ -57,6 +74,7 @@ async def debug_widgets(request):
     
     widget_info = []
     for widget in widgets:
+        rendered = widget.render()
         widget_info.append({
             "identifier": widget.identifier,
             "title": widget.title,
@@ -65,8 +83,11 @@ async def debug_widgets(request):
             "invoking": widget.invoking,
             "invoked": widget.invoked,
             "response_text": widget.response_text,
-            "html_length": len(widget.html),
-            "html_preview": widget.html[:200] + "..." if len(widget.html) > 200 else widget.html,
+            "html_length": len(rendered.html),
+            "html_preview": rendered.html[:200] + "..." if len(rendered.html) > 200 else rendered.html,
+            "gzip_length": len(rendered.gzip_body),
+            "brotli_length": len(rendered.brotli_body) if rendered.brotli_body is not None else None,
+            "etag": rendered.etag,
         })
     
     return JSONResponse({
@@ -78,6 +99,108 @@ async def debug_widgets(request):
     })
 
 
+async def debug_cache(request):
+    """Debug endpoint showing benefit-terms cache and request coalescing counters."""
+    return JSONResponse({
+        "benefits_cache": benefits_cache.stats(),
+        "benefits_single_flight": benefits_flights.stats(),
+    })
+
+
+async def debug_profiling(request):
+    """
+    Show or change request profiling (see profiling.py).
+    
+    GET returns the current settings. POST with a JSON body such as
+    ``{"enabled": true, "sample_rate": 0.05}`` changes them; it requires
+    ``Authorization: Bearer <PROFILING_ADMIN_TOKEN>`` and is refused when
+    no token is configured.
+    """
+    if request.method == "POST":
+        if not PROFILING_ADMIN_TOKEN:
+            return JSONResponse({"error": "Profiling toggle is disabled (PROFILING_ADMIN_TOKEN not set)"}, status_code=403)
+        if not secrets.compare_digest(request.headers.get("authorization", ""), f"Bearer {PROFILING_ADMIN_TOKEN}"):
+            return JSONResponse({"error": "Unauthorized"}, status_code=401)
+        try:
+            body = await request.json()
+            enabled = body.get("enabled")
+            sample_rate = body.get("sample_rate")
+            if enabled is not None and not isinstance(enabled, bool):
+                raise ValueError("enabled must be a boolean")
+            profiler.configure(
+                enabled=enabled,
+                sample_rate=float(sample_rate) if sample_rate is not None else None,
+            )
+        except (ValueError, TypeError, AttributeError) as e:
+            return JSONResponse({"error": f"Invalid profiling settings: {e}"}, status_code=400)
+    
+    return JSONResponse(profiler.stats())
+
+
+async def metrics(request):
+    """Prometheus metrics endpoint (tool calls, upstream latency, cache and resource counters)."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+async def widget_html(request):
+    """Serve a widget's rendered HTML with ETag revalidation and precompressed bodies."""
+    widget = WIDGETS_BY_ID.get(request.path_params["identifier"])
+    if widget is None:
+        return JSONResponse({"error": "Unknown widget"}, status_code=404)
+    
+    rendered = widget.render()
+    headers = {
+        "ETag": rendered.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    
+    if request.headers.get("if-none-match") == rendered.etag:
+        return Response(status_code=304, headers=headers)
+    
+    accept_encoding = request.headers.get("accept-encoding", "")
+    body = rendered.body
+    if rendered.brotli_body is not None and "br" in accept_encoding:
+        body = rendered.brotli_body
+        headers["Content-Encoding"] = "br"
+    elif "gzip" in accept_encoding:
+        body = rendered.gzip_body
+        headers["Content-Encoding"] = "gzip"
+    
+    return Response(body, media_type="text/html; charset=utf-8", headers=headers)
+
+
+async def card_image(request):
+    """
+    Serve a card image from memory with a content-hash ETag.
+    
+    Versioned URLs (``?v=<content hash>``, see ``ImageAsset.url``) are cached
+    as immutable; other URLs revalidate with the ETag. A WebP variant
+    (encoded on first use) is served to clients that accept it.
+    """
+    images = get_card_images()
+    asset = images.get(request.path_params["filename"])
+    if asset is None:
+        return JSONResponse({"error": "Unknown image"}, status_code=404)
+    
+    versioned = request.query_params.get("v") == asset.version
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL if versioned else REVALIDATE_CACHE_CONTROL}
+    
+    body, media_type, etag = asset.body, asset.media_type, asset.etag
+    if asset.webp_eligible:
+        headers["Vary"] = "Accept"
+        if "image/webp" in request.headers.get("accept", ""):
+            webp_body = await images.webp_body(asset)
+            if webp_body is not None:
+                body, media_type, etag = webp_body, "image/webp", f'{asset.etag[:-1]}-webp"'
+    headers["ETag"] = etag
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(body, media_type=media_type, headers=headers)
+
+
 async def api_fetch_reward_benefits(request):
     """API endpoint to fetch reward benefits for one or more cards."""
     card_title = request.query_params.get('card_title')
@@ -92,7 +215,7 @@ async def api_fetch_reward_benefits(request):
     # The service function now expects a list
     card_titles = [card_title]
     
-    result = fetch_reward_benefits(card_titles)
+    result = await fetch_reward_benefits_async(card_titles)
     return JSONResponse(result)
 
 
@@ -114,6 +237,21 @@ async def api_fetch_rates_and_fees(request):
     return JSONResponse(result)
 
 
+async def api_fetch_card_details(request):
+    """API endpoint to fetch reward benefits and rates and fees for many cards in one round trip."""
+    # Repeat the parameter for several cards: ?card_title=Active Cash&card_title=VV
+    card_titles = [title for title in request.query_params.getlist('card_title') if title.strip()]
+    
+    if not card_titles:
+        return JSONResponse({
+            "success": False,
+            "error": "card_title parameter is required"
+        }, status_code=400)
+    
+    result = await fetch_card_details(card_titles)
+    return JSONResponse(result)
+
+
 def get_routes():
     """Get all HTTP routes."""
     return [
@@ -121,6 +259,12 @@ def get_routes():
         Route("/health", health),
         Route("/info", server_info),
         Route("/debug/widgets", debug_widgets),
+        Route("/debug/cache", debug_cache),
+        Route("/debug/profiling", debug_profiling, methods=["GET", "POST"]),
+        Route("/metrics", metrics),
+        Route("/widgets/{identifier}", widget_html),
+        Route("/assets/images/credit-cards/{filename}", card_image),
         Route("/api/fetch_reward_benefits", api_fetch_reward_benefits),
         Route("/api/fetch_rates_and_fees", api_fetch_rates_and_fees),
+        Route("/api/fetch_card_details", api_fetch_card_details),
     ]
@@ -2,6 +2,7 @@
 Input validation schemas for Credit Card Finder MCP Server tools.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field, ConfigDict
 from service import CardCategory
@@ -38,6 +39,25 @@ class ListCardsInput(BaseModel):
         This helps users who want to avoid paying yearly maintenance fees on their credit cards.
         """
     )
+    dedupe: bool = Field(
+        False,
+        description="""List each card once instead of once per category it belongs to.
+        
+        Merged cards carry a "categories" list of every category they appear in. Recommended when
+        browsing all categories, where several cards would otherwise be repeated. The summary view
+        is always deduplicated.
+        """
+    )
+    view: Literal["full", "summary"] = Field(
+        "full",
+        description="""Shape of the returned card data.
+        
+        - full: Every card field, with a card repeated once per category it belongs to (default)
+        - summary: Each card once, with a "categories" list and only the fields shown in the card list
+          (title, subtitle, intro offer, rewards, annual fee, image URL). Much smaller; use it when the full
+          card details aren't needed.
+        """
+    )
 
 
 class FetchRewardBenefitsInput(BaseModel):
@@ -111,6 +131,24 @@ class FetchRatesAndFeesInput(BaseModel):
     )
 
 
+class CardTitlesInput(BaseModel):
+    """
+    Arguments for the fetch tools, matching the schema they advertise.
+
+    Titles are free-form strings: spellings with ®/™/℠ or HTML and card codes
+    are resolved by the service layer, and unknown cards are reported per card.
+    """
+    card_titles: List[str] = Field(
+        ...,
+        min_length=1,
+        description="List of Wells Fargo credit card names"
+    )
+
+
+class NoArgumentsInput(BaseModel):
+    """Arguments for tools that take none (extra arguments are ignored)."""
+
+
 class BenefitRow(BaseModel):
     """Schema for a benefit comparison row."""
     benefit_name: str = Field(
@@ -164,9 +202,13 @@ class CompareCardsOutput(BaseModel):
         - ["Autograph Journey", "One Key+ Card"]
         """
     )
-    benefit_rows: List[BenefitRow] = Field(
-        ...,
-        description="List of benefit rows, where each row contains a benefit category and values for each card"
+    benefit_rows: Optional[List[BenefitRow]] = Field(
+        None,
+        description="""List of benefit rows, where each row contains a benefit category and values for each card.
+        
+        Omit to have the server fill in standard rows from its card fact table: Annual fee, Intro APR,
+        Balance transfer fee, Foreign transaction fees and Rewards rate. No fetch calls are needed first.
+        """
     )
     recommended_card: RecommendedCard = Field(
         ...,
@@ -175,8 +217,9 @@ class CompareCardsOutput(BaseModel):
 
 
 # Generate JSON schemas for all input models
+@lru_cache(maxsize=None)
 def get_schemas() -> Dict[str, Dict[str, Any]]:
-    """Get all tool input schemas as JSON."""
+    """Get all tool input schemas as JSON (generated once; treat as read-only)."""
     return {
         "list_wells_fargo_credit_cards": ListCardsInput.model_json_schema(),
         "fetch_wells_fargo_rewards_and_benefits": FetchRewardBenefitsInput.model_json_schema(),
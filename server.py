@@ -8,21 +8,31 @@ and sets up HTTP routes for the server.
 To run the server:
     python -m uvicorn server:app --reload --host 0.0.0.0 --port 8000
 
+To run multiple workers sharing pre-built card data and widget HTML (production):
+    gunicorn -c gunicorn.conf.py server:app
+
 The server exposes:
 - SSE endpoint: http://localhost:8000/mcp
 - Streamable-HTTP endpoint: http://localhost:8000/mcp/messages
 - Health check: http://localhost:8000/health
 - Server info: http://localhost:8000/info
 - Debug widgets: http://localhost:8000/debug/widgets
+- Debug cache: http://localhost:8000/debug/cache
+- Debug profiling: http://localhost:8000/debug/profiling
+- Metrics: http://localhost:8000/metrics
+- Card images: http://localhost:8000/assets/images/credit-cards/<file>
 """
 
+import asyncio
 import logging
 import sys
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 from starlette.middleware.cors import CORSMiddleware
 
 # Import configuration
 from config import (
+    LOG_LEVEL,
     SERVER_NAME,
     SERVER_VERSION,
     SERVER_DESCRIPTION,
@@ -33,6 +43,9 @@ from config import (
     CORS_ALLOW_METHODS,
     CORS_ALLOW_HEADERS,
     CORS_ALLOW_CREDENTIALS,
+    BENEFITS_SNAPSHOT_ENABLED,
+    BENEFITS_SNAPSHOT_REFRESH_SECONDS,
+    CARD_DATA_RELOAD_SECONDS,
 )
 
 # Import MCP handlers registration
@@ -44,13 +57,26 @@ from routes import get_routes
 # Import widgets for logging
 from widgets import widgets, HAS_UI
 
+# Import card images for startup warm-up
+from assets import get_card_images
+
+# Import upstream client for shutdown cleanup, card data and benefits snapshot for startup warm-up and reloading
+from service import (
+    benefits_snapshot,
+    close_http_client,
+    get_card_data,
+    run_benefits_snapshot_refresher,
+    run_card_data_reloader,
+)
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
 
-# Configure logging with force to override any previous configuration
+# Configure logging with force to override any previous configuration.
+# The level comes from the LOG_LEVEL environment variable (default INFO).
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL,
     format='%(levelname)s:%(name)s: %(message)s',
     stream=sys.stdout,
     force=True  # This forces reconfiguration
@@ -58,10 +84,6 @@ logging.basicConfig(
 
 # Create logger for this module
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
-# Also set the root logger to DEBUG
-logging.getLogger().setLevel(logging.DEBUG)
 
 # Suppress verbose logs from uvicorn and mcp
 logging.getLogger('uvicorn').setLevel(logging.INFO)
@@ -170,6 +192,28 @@ def configure_app(mcp: FastMCP):
     logger.info("✅ Custom routes added")
     logger.info("")
     
+    # Refresh the benefits snapshot and reload changed card data files in the
+    # background while the app runs, and close the shared upstream client when it shuts down
+    mcp_lifespan = app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        background = []
+        if BENEFITS_SNAPSHOT_ENABLED and BENEFITS_SNAPSHOT_REFRESH_SECONDS > 0:
+            background.append(asyncio.create_task(run_benefits_snapshot_refresher(BENEFITS_SNAPSHOT_REFRESH_SECONDS)))
+        if CARD_DATA_RELOAD_SECONDS > 0:
+            background.append(asyncio.create_task(run_card_data_reloader(CARD_DATA_RELOAD_SECONDS)))
+        try:
+            async with mcp_lifespan(app) as state:
+                yield state
+        finally:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            await close_http_client()
+    
+    app.router.lifespan_context = lifespan
+    
     logger.info("✅ Application configuration completed!")
     logger.info("=" * 80)
     logger.info("")
@@ -181,6 +225,9 @@ def configure_app(mcp: FastMCP):
     logger.info("   - Health check: /health")
     logger.info("   - Server info: /info")
     logger.info("   - Debug widgets: /debug/widgets")
+    logger.info("   - Debug cache: /debug/cache")
+    logger.info("   - Debug profiling: /debug/profiling")
+    logger.info("   - Metrics: /metrics")
     logger.info("")
     logger.info("=" * 80)
     
@@ -198,6 +245,16 @@ logger.info("🌟 CREDIT CARD FINDER MCP SERVER INITIALIZATION")
 logger.info("=" * 80)
 logger.info("")
 
+# Parse card data and render widget HTML once up front so the first request doesn't pay for it.
+# Under gunicorn (preload_app) this runs before workers fork, so they share it.
+# A missing or invalid rates and fees file fails startup here (DataLoadError).
+get_card_images()
+get_card_data()
+if BENEFITS_SNAPSHOT_ENABLED:
+    benefits_snapshot.load()
+for widget in widgets:
+    widget.render()
+
 mcp = create_mcp_server()
 
 # Configure the ASGI application
@@ -3,15 +3,66 @@ Business logic layer for Credit Card Finder MCP Server.
 Contains all service functions that interact with data.
 """
 
-import json
+import asyncio
 import logging
+import os
 import re
-import requests
-from typing import List, Dict, Any, Optional
+import time
+import backoff
+import httpx
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Mapping, Optional, Set, Tuple
 from enum import Enum
+from urllib.parse import urlsplit
 
-# Setup logging
-logging.basicConfig(level=logging.DEBUG)
+from cache import SingleFlight, StaleWhileRevalidateCache
+from circuit_breaker import CLOSED, CircuitBreaker
+from assets import get_card_images
+from catalog import (
+    BENEFIT_TERMS_DIR,
+    LIST_CARDS_PATH,
+    RATES_AND_FEES_DIR,
+    CardCatalog,
+    CardList,
+    ComparisonFacts,
+    RatesStore,
+    clean_card_title,
+    rates_and_fees_filename,
+)
+from config import (
+    COMPACT_JSON,
+    CARD_DATA_RELOAD_SECONDS,
+    BENEFITS_SNAPSHOT_ENABLED,
+    BENEFITS_SNAPSHOT_REFRESH_SECONDS,
+    BENEFITS_SNAPSHOT_MAX_AGE_SECONDS,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_SECONDS,
+    CIRCUIT_SLOW_CALL_SECONDS,
+    BENEFITS_CACHE_TTL_SECONDS,
+    BENEFITS_CACHE_MAX_STALE_SECONDS,
+    BENEFITS_CACHE_MAX_SIZE,
+    UPSTREAM_BASE_URL,
+    UPSTREAM_TIMEOUT_SECONDS,
+    UPSTREAM_DEADLINE_SECONDS,
+    UPSTREAM_MAX_CONNECTIONS,
+    UPSTREAM_KEEPALIVE_EXPIRY_SECONDS,
+    UPSTREAM_MAX_TRIES,
+    UPSTREAM_RETRY_BACKOFF_SECONDS,
+    UPSTREAM_MIN_TIMEOUT_SECONDS,
+    UPSTREAM_TIMEOUT_P99_MULTIPLIER,
+)
+from metrics import (
+    BENEFITS_SNAPSHOT_HITS,
+    REGISTRY,
+    UPSTREAM_LATENCY,
+    CallbackMetric,
+)
+from snapshot import SnapshotStore
+
+# Setup logging (level is configured by server.py from LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 class CardCategory(str, Enum):
@@ -74,25 +125,267 @@ CARD_METADATA = {
 
 CARD_CODE_TO_TITLE = {v["code"]: k for k, v in CARD_METADATA.items()}
 
+# Title normalization pattern (see also catalog.clean_card_title)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def _alias_key(card_title: str) -> str:
+    """Normalize a title or code for case- and whitespace-insensitive matching."""
+    return _WHITESPACE_RE.sub(' ', clean_card_title(card_title)).lower()
+
+
+class CardTitleResolver:
+    """
+    Resolve any known spelling of a card to its canonical CARD_METADATA title.
+    
+    At construction it indexes raw titles (e.g. "Active Cash<sup>®</sup>"),
+    cleaned titles, card codes ("AC", "MT"...) and their case and whitespace
+    variants, so known spellings resolve with a single dict hit. Other input
+    falls back to one normalized lookup.
+    """
+    
+    def __init__(self, card_metadata: Mapping[str, dict], raw_titles: Iterable[str] = ()):
+        self._aliases: Dict[str, str] = {}
+        for title, metadata in card_metadata.items():
+            for alias in (title, metadata["code"]):
+                self._add(alias, title)
+        for raw_title in raw_titles:
+            title = self._aliases.get(_alias_key(raw_title))
+            if title is not None:
+                self._add(raw_title, title)
+    
+    def _add(self, alias: str, title: str) -> None:
+        for variant in (alias, clean_card_title(alias), alias.lower(), alias.upper(), _alias_key(alias)):
+            self._aliases.setdefault(variant, title)
+    
+    def resolve(self, card_title: str) -> Optional[str]:
+        """Get the canonical title for a card title or code, or None if unknown."""
+        title = self._aliases.get(card_title)
+        if title is None:
+            title = self._aliases.get(_alias_key(card_title))
+        return title
+
+
+# Key of list_cards.json in CardData.file_mtimes (rates and fees files are keyed by card code)
+LIST_CARDS_KEY = "list_cards"
+
+
+@dataclass(frozen=True)
+class CardData:
+    """
+    One immutable version of the card data files and everything built from them.
+    
+    ``reload_card_data`` builds a complete new version and swaps it in with a
+    single reference assignment, so a request never sees a half-built state.
+    Callers that need several parts (e.g. resolver and rates store) take one
+    version with ``get_card_data()`` and use it throughout.
+    """
+    version: int
+    catalog: CardCatalog
+    rates_store: RatesStore
+    title_resolver: CardTitleResolver
+    comparison_facts: ComparisonFacts
+    file_mtimes: Mapping[str, Optional[int]]  # Source file key -> st_mtime_ns when read (None if missing)
+    loaded_at: float                          # Unix time the version was swapped in
+    
+    def info(self) -> Dict[str, Any]:
+        """Version summary for /info."""
+        return {
+            "version": self.version,
+            "loaded_at": datetime.fromtimestamp(self.loaded_at, timezone.utc).isoformat(),
+            "cards": self.catalog.size,
+        }
+
+
+# Current card data version (see get_card_data and reload_card_data)
+_card_data: Optional[CardData] = None
+
+# File mtimes last looked at by reload_card_data, including changes that failed to load
+_seen_file_mtimes: Optional[Dict[str, Optional[int]]] = None
+
+
+def _card_data_paths() -> Dict[str, Path]:
+    """Source file of each part of the card data, keyed by LIST_CARDS_KEY or card code."""
+    paths = {LIST_CARDS_KEY: LIST_CARDS_PATH}
+    for code, title in CARD_CODE_TO_TITLE.items():
+        paths[code] = RATES_AND_FEES_DIR / rates_and_fees_filename(title)
+    return paths
+
+
+def _file_mtimes() -> Dict[str, Optional[int]]:
+    mtimes: Dict[str, Optional[int]] = {}
+    for key, path in _card_data_paths().items():
+        try:
+            mtimes[key] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtimes[key] = None
+    return mtimes
+
+
+def _build_card_data(version: int, catalog: CardCatalog, rates_store: RatesStore, file_mtimes: Dict[str, Optional[int]]) -> CardData:
+    """Derive the title resolver and comparison facts and bundle one version."""
+    raw_titles = {card.get('title', '') for card in catalog.lookup()}
+    cards_by_title = {clean_card_title(card.get('title', '')): card for card in catalog.lookup(dedupe=True)}
+    return CardData(
+        version=version,
+        catalog=catalog,
+        rates_store=rates_store,
+        title_resolver=CardTitleResolver(CARD_METADATA, raw_titles),
+        comparison_facts=ComparisonFacts.build(CARD_CODE_TO_TITLE, cards_by_title, rates_store),
+        file_mtimes=file_mtimes,
+        loaded_at=time.time(),
+    )
+
+
+def get_card_data() -> CardData:
+    """
+    Get the current card data version, loading it on first use.
+    
+    Raises:
+        DataLoadError: If any card's rates and fees file is missing or invalid
+    """
+    global _card_data
+    if _card_data is None:
+        # Stat before reading, so a write that lands mid-load is picked up by the next reload
+        file_mtimes = _file_mtimes()
+        catalog = CardCatalog.from_file(compact_json=COMPACT_JSON)
+        _card_data = _build_card_data(1, catalog, RatesStore.from_dir(CARD_CODE_TO_TITLE), file_mtimes)
+    return _card_data
+
+
+def get_catalog() -> CardCatalog:
+    """Get the current card catalog (see get_card_data)."""
+    return get_card_data().catalog
+
+
+def get_title_resolver() -> CardTitleResolver:
+    """Get the current title resolver (see get_card_data)."""
+    return get_card_data().title_resolver
+
+
+def reload_card_data() -> bool:
+    """
+    Reload card data files that changed since they were last looked at.
+    
+    Only changed files are parsed: list_cards.json rebuilds the catalog, and a
+    rates and fees file replaces that card's document in a copy of the store.
+    The title resolver and comparison facts are rebuilt from the result. The
+    new version is fully built and validated before it is swapped in; if any
+    part fails, the current version stays and the change is retried only once
+    the file changes again.
+    
+    Returns:
+        True if a new version was swapped in
+    """
+    global _card_data, _seen_file_mtimes
+    current = get_card_data()
+    seen = _seen_file_mtimes if _seen_file_mtimes is not None else current.file_mtimes
+    file_mtimes = _file_mtimes()
+    changed = [key for key, mtime in file_mtimes.items() if mtime != seen.get(key)]
+    if not changed:
+        return False
+    
+    _seen_file_mtimes = file_mtimes
+    paths = _card_data_paths()
+    logger.info("🔄 Card data changed: %s", ", ".join(paths[key].name for key in changed))
+    
+    try:
+        catalog = current.catalog
+        if LIST_CARDS_KEY in changed:
+            catalog = CardCatalog.from_file(compact_json=COMPACT_JSON, strict=True)
+        
+        documents = {
+            key: RatesStore.read_document(paths[key])
+            for key in changed
+            if key != LIST_CARDS_KEY
+        }
+        rates_store = current.rates_store.replace(documents, CARD_CODE_TO_TITLE) if documents else current.rates_store
+        
+        new_data = _build_card_data(current.version + 1, catalog, rates_store, file_mtimes)
+    except Exception as e:
+        logger.error("❌ Card data reload failed, keeping version %d: %s", current.version, e)
+        return False
+    
+    _card_data = new_data
+    logger.info("✅ Card data version %d loaded (%d card record(s))", new_data.version, new_data.catalog.size)
+    return True
+
+
+async def run_card_data_reloader(interval: float = CARD_DATA_RELOAD_SECONDS) -> None:
+    """Poll the card data files' mtimes every ``interval`` seconds and reload changes until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            reload_card_data()
+        except Exception as e:
+            logger.error("❌ Card data reload check failed: %s", e)
+
+
+REGISTRY.register(CallbackMetric(
+    "card_data_version", "Version of the card data currently served (incremented by each reload).", "gauge",
+    lambda: {(): _card_data.version if _card_data is not None else 0},
+))
+
+
 # Base URL for Wells Fargo
-BASE_URL = "https://web.secure.wellsfargo.com"
+BASE_URL = UPSTREAM_BASE_URL
+
+# Shared keep-alive client for upstream requests (created on first use)
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Benefit-terms responses keyed by card code; they change rarely upstream
+benefits_cache = StaleWhileRevalidateCache(
+    maxsize=BENEFITS_CACHE_MAX_SIZE,
+    ttl=BENEFITS_CACHE_TTL_SECONDS,
+    max_stale=BENEFITS_CACHE_MAX_STALE_SECONDS,
+)
+
+# Concurrent upstream fetches for the same card code share one request
+benefits_flights = SingleFlight()
+
+REGISTRY.register(CallbackMetric(
+    "benefits_cache_lookups_total", "Benefit-terms cache lookups by result.", "counter",
+    lambda: {("hit",): benefits_cache.hits, ("stale",): benefits_cache.stale_hits, ("miss",): benefits_cache.misses},
+    ("result",),
+))
+REGISTRY.register(CallbackMetric(
+    "benefits_cache_hit_ratio", "Fraction of benefit-terms cache lookups served from cache (fresh or stale).", "gauge",
+    lambda: {(): benefits_cache.stats()["hit_ratio"]},
+))
+REGISTRY.register(CallbackMetric(
+    "benefits_single_flight_shared_total", "Upstream fetches avoided by joining an in-flight request.", "counter",
+    lambda: {(): benefits_flights.shared},
+))
+
+# Circuit breakers for upstream hosts, keyed by host (see get_circuit_breaker)
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+REGISTRY.register(CallbackMetric(
+    "upstream_circuit_open", "1 while the upstream host's circuit breaker is not closed.", "gauge",
+    lambda: {(host,): int(breaker.state != CLOSED) for host, breaker in _circuit_breakers.items()},
+    ("host",),
+))
+
+# Offline copy of each card's benefit terms, kept fresh by run_benefits_snapshot_refresher
+benefits_snapshot = SnapshotStore(BENEFIT_TERMS_DIR)
 
 
 def _get_card_metadata(card_title: str) -> Optional[dict]:
     """
     Get complete metadata for a card given its title.
-    Handles titles with HTML tags and superscript characters (®, ™, ℠).
+    Handles titles with HTML tags and superscript characters (®, ™, ℠),
+    card codes, and case and whitespace variants.
     
     Args:
-        card_title: The card title (may include HTML tags and superscripts)
+        card_title: The card title or code (may include HTML tags and superscripts)
         
     Returns:
         Dictionary with keys: code, feature_benefit_terms_url, card_image
         or None if not found
     """
-    clean_title = re.sub(r'<[^>]+>', '', card_title)
-    clean_title = re.sub(r'[®™℠]', '', clean_title).strip()
-    return CARD_METADATA.get(clean_title)
+    title = get_title_resolver().resolve(card_title)
+    return CARD_METADATA[title] if title else None
 
 
 def _get_card_feature_benefit_url(card_title: str) -> Optional[str]:
@@ -123,79 +416,275 @@ def get_card_image(card_title: str) -> Optional[str]:
     return metadata["card_image"] if metadata else None
 
 
-def fetch_reward_benefits(card_titles: List[str]) -> Dict[str, Any]:
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared upstream HTTP client.
+    
+    The client keeps connections to the Wells Fargo host alive between calls
+    and caps the number of concurrent connections to it.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=UPSTREAM_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=UPSTREAM_MAX_CONNECTIONS,
+                max_keepalive_connections=UPSTREAM_MAX_CONNECTIONS,
+                keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared upstream HTTP client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Get the circuit breaker for the host of ``url``, creating it on first use."""
+    host = urlsplit(url).netloc
+    breaker = _circuit_breakers.get(host)
+    if breaker is None:
+        breaker = _circuit_breakers[host] = CircuitBreaker(
+            host,
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=CIRCUIT_RESET_SECONDS,
+            slow_call_seconds=CIRCUIT_SLOW_CALL_SECONDS,
+            default_timeout=UPSTREAM_TIMEOUT_SECONDS,
+            min_timeout=UPSTREAM_MIN_TIMEOUT_SECONDS,
+            timeout_multiplier=UPSTREAM_TIMEOUT_P99_MULTIPLIER,
+        )
+    return breaker
+
+
+def circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """State and latency figures for every upstream host contacted so far."""
+    return {host: breaker.stats() for host, breaker in _circuit_breakers.items()}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Transport errors, timeouts and 5xx responses are retried; 4xx responses are not."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return True
+
+
+async def _get_with_retries(client: httpx.AsyncClient, url: str, breaker: CircuitBreaker) -> httpx.Response:
+    """
+    GET ``url`` with jittered exponential backoff, reporting each attempt to ``breaker``.
+    
+    Each attempt uses the breaker's p99-derived timeout, and every attempt
+    records an outcome, so a half-open probe is always released. Retrying
+    stops once the breaker leaves the closed state.
+    
+    Raises:
+        httpx.HTTPError: The last error once attempts are exhausted
+    """
+    async def attempt() -> httpx.Response:
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            response = await client.get(url, timeout=breaker.timeout())
+            if response.status_code >= 500:
+                response.raise_for_status()
+            succeeded = True
+        finally:
+            # Any other outcome is a failure, including cancellation by the fetch deadline
+            if succeeded:
+                breaker.record_success(time.perf_counter() - start)
+            else:
+                breaker.record_failure()
+        response.raise_for_status()
+        return response
+    
+    def log_retry(details: Dict[str, Any]) -> None:
+        logger.warning("  🔁 Retrying %s in %.2fs after attempt %d failed: %s",
+                       url, details["wait"], details["tries"], details["exception"])
+    
+    retrying = backoff.on_exception(
+        backoff.expo,
+        httpx.HTTPError,
+        max_tries=UPSTREAM_MAX_TRIES,
+        jitter=backoff.full_jitter,
+        giveup=lambda e: not _is_retryable(e) or not breaker.closed,
+        on_backoff=log_retry,
+        logger=None,
+        factor=UPSTREAM_RETRY_BACKOFF_SECONDS,
+    )(attempt)
+    return await retrying()
+
+
+async def _fetch_card_benefits(client: httpx.AsyncClient, card_title: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch reward benefits for a single card.
+    
+    Fails fast without a request while the upstream host's circuit breaker is
+    open; otherwise retries transient failures (see ``_get_with_retries``).
+    
+    Returns:
+        Tuple of (result, error) where exactly one is set
+    """
+    rewards_path = _get_card_feature_benefit_url(card_title)
+    
+    if not rewards_path:
+        error_msg = f"No feature and benefit terms URL found for card: {card_title}"
+        logger.error("  ❌ %s", error_msg)
+        return None, error_msg
+    
+    full_url = f"{BASE_URL}{rewards_path}"
+    breaker = get_circuit_breaker(full_url)
+    if not breaker.allow():
+        error_msg = f"Upstream {breaker.name} is unavailable (circuit open); not fetching reward benefits"
+        logger.warning("  ⚡ %s", error_msg)
+        return None, error_msg
+    
+    logger.debug("  Requesting: %s", full_url)
+    
+    code = _get_card_metadata(card_title)["code"]
+    start = time.perf_counter()
+    try:
+        response = await _get_with_retries(client, full_url, breaker)
+    except httpx.TimeoutException:
+        UPSTREAM_LATENCY.observe(time.perf_counter() - start, code, "timeout")
+        error_msg = "Request timeout while fetching reward benefits"
+        logger.error("  ❌ %s", error_msg)
+        return None, error_msg
+    except httpx.HTTPError as e:
+        UPSTREAM_LATENCY.observe(time.perf_counter() - start, code, "error")
+        error_msg = f"Error fetching reward benefits: {str(e)}"
+        logger.error("  ❌ %s", error_msg)
+        return None, error_msg
+    UPSTREAM_LATENCY.observe(time.perf_counter() - start, code, "success")
+    
+    logger.info("  ✅ Successfully fetched reward benefits for %s", card_title)
+    
+    # Try to parse as JSON, fallback to text
+    try:
+        data = response.json()
+    except ValueError:
+        data = response.text
+    
+    return {"data": data, "url": full_url}, None
+
+
+async def _get_card_benefits(client: httpx.AsyncClient, card_title: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Get reward benefits for a single card, serving from ``benefits_snapshot`` or ``benefits_cache`` when possible.
+    
+    A card with an on-disk snapshot younger than BENEFITS_SNAPSHOT_MAX_AGE_SECONDS
+    never waits on upstream. Otherwise stale cache entries (or a stale snapshot,
+    within BENEFITS_CACHE_MAX_STALE_SECONDS) are returned immediately while a
+    background refresh runs. Misses for the same card code are coalesced into
+    one upstream request, and only successful responses are cached.
     """
-    Fetch reward benefits and terms for one or more credit cards from Wells Fargo.
+    metadata = _get_card_metadata(card_title)
+    if not metadata:
+        return await _fetch_card_benefits(client, card_title)
+    
+    code = metadata["code"]
+    snapshot = benefits_snapshot.get(code) if BENEFITS_SNAPSHOT_ENABLED else None
+    snapshot_age = time.time() - snapshot.get("fetched_at", 0) if snapshot is not None else None
+    if snapshot is not None and snapshot_age < BENEFITS_SNAPSHOT_MAX_AGE_SECONDS:
+        BENEFITS_SNAPSHOT_HITS.inc(code)
+        return {"data": snapshot["data"], "url": snapshot["url"]}, None
+    
+    cached = benefits_cache.get(code)
+    if cached is not None:
+        result, is_stale = cached
+        if is_stale:
+            logger.debug("  ♻️  Serving stale benefits for %s, refreshing in background", card_title)
+            benefits_cache.revalidate(code, lambda: _refetch_card_benefits(card_title, code))
+        return result, None
+    
+    if snapshot is not None and snapshot_age < BENEFITS_SNAPSHOT_MAX_AGE_SECONDS + BENEFITS_CACHE_MAX_STALE_SECONDS:
+        logger.debug("  ♻️  Serving stale snapshot for %s, refreshing in background", card_title)
+        BENEFITS_SNAPSHOT_HITS.inc(code)
+        benefits_cache.revalidate(code, lambda: _refetch_card_benefits(card_title, code))
+        return {"data": snapshot["data"], "url": snapshot["url"]}, None
+    
+    return await benefits_flights.do(code, lambda: _fetch_and_cache_card_benefits(client, card_title, code))
+
+
+async def _fetch_and_cache_card_benefits(client: httpx.AsyncClient, card_title: str, code: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Fetch benefits for one card and store successful responses in ``benefits_cache`` and the snapshot."""
+    result, error_msg = await _fetch_card_benefits(client, card_title)
+    if result is not None:
+        benefits_cache.set(code, result)
+        if BENEFITS_SNAPSHOT_ENABLED:
+            _save_benefits_snapshot_in_background(code, result)
+    return result, error_msg
+
+
+async def _refetch_card_benefits(card_title: str, code: str) -> Optional[Dict[str, Any]]:
+    """Background refresh for ``benefits_cache`` (and the snapshot); returns None on failure."""
+    result, _ = await benefits_flights.do(code, lambda: _fetch_card_benefits(get_http_client(), card_title))
+    if result is not None and BENEFITS_SNAPSHOT_ENABLED:
+        await _save_benefits_snapshot(code, result)
+    return result
+
+
+async def fetch_reward_benefits_async(card_titles: List[str], deadline: float = UPSTREAM_DEADLINE_SECONDS) -> Dict[str, Any]:
+    """
+    Fetch reward benefits and terms for one or more credit cards from Wells Fargo concurrently.
+    
+    Per-card requests are sent together over the shared keep-alive client, so
+    N cards take about as long as the slowest single request. Responses are
+    cached per card code in ``benefits_cache``. Cards still pending when
+    ``deadline`` seconds have passed are cancelled and reported as errors.
     
     Args:
-        card_titles: List of card titles (e.g., ["Active Cash", "Autograph®", "Reflect"])
+        card_titles: List of card titles (e.g., ["Active Cash", "Autograph®", "Reflect"]);
+            repeated titles are fetched and reported once
+        deadline: Overall time budget in seconds for all cards
         
     Returns:
         Dictionary containing:
         - success (bool): Whether all requests were successful
         - data (dict): Dictionary mapping card titles to their benefit data
         - errors (dict): Dictionary mapping card titles to error messages (if any)
-        - count (int): Number of cards processed
-        
-    Example:
-        result = fetch_reward_benefits(["Active Cash®", "Reflect®"])
-        if result['success']:
-            for card, benefits in result['data'].items():
-                print(f"{card}: {benefits}")
+        - count (int): Number of distinct cards processed
+        - successful / failed (int): Number of cards in ``data`` / ``errors``
     """
-    logger.info(f"🎁 Fetching reward benefits for {len(card_titles)} card(s): {card_titles}")
+    # Repeated titles share one task (and one result), so none is left unawaited
+    card_titles = list(dict.fromkeys(card_titles))
+    logger.info("🎁 Fetching reward benefits for %s card(s): %s", len(card_titles), card_titles)
+    
+    client = get_http_client()
+    tasks = {
+        card_title: asyncio.ensure_future(_get_card_benefits(client, card_title))
+        for card_title in card_titles
+    }
+    
+    if tasks:
+        _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
     results = {}
     errors = {}
     
-    for card_title in card_titles:
-        logger.info(f"  Processing: {card_title}")
-        
-        # Get the feature and benefit terms URL from metadata
-        rewards_path = _get_card_feature_benefit_url(card_title)
-        
-        if not rewards_path:
-            error_msg = f"No feature and benefit terms URL found for card: {card_title}"
-            logger.error(f"  ❌ {error_msg}")
+    for card_title, task in tasks.items():
+        if task.cancelled():
+            error_msg = f"Deadline of {deadline:g}s exceeded while fetching reward benefits"
+            logger.error("  ❌ %s: %s", card_title, error_msg)
             errors[card_title] = error_msg
             continue
         
-        # Construct full URL
-        full_url = f"{BASE_URL}{rewards_path}"
-        logger.debug(f"  Requesting: {full_url}")
-        
-        try:
-            # Make HTTP GET request
-            response = requests.get(full_url, timeout=10)
-            response.raise_for_status()
-            
-            logger.info(f"  ✅ Successfully fetched reward benefits for {card_title}")
-            
-            # Try to parse as JSON, fallback to text
-            try:
-                data = response.json()
-            except ValueError:
-                data = response.text
-            
-            results[card_title] = {
-                "data": data,
-                "url": full_url
-            }
-            
-        except requests.exceptions.Timeout:
-            error_msg = f"Request timeout while fetching reward benefits"
-            logger.error(f"  ❌ {error_msg}")
-            errors[card_title] = error_msg
-            
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Error fetching reward benefits: {str(e)}"
-            logger.error(f"  ❌ {error_msg}")
+        result, error_msg = task.result()
+        if error_msg:
             errors[card_title] = error_msg
+        else:
+            results[card_title] = result
     
-    # Determine overall success
     success = len(results) > 0 and len(errors) == 0
     
-    logger.info(f"✅ Completed fetching benefits: {len(results)} successful, {len(errors)} failed")
+    logger.info("✅ Completed fetching benefits: %s successful, %s failed", len(results), len(errors))
     
     return {
         "success": success,
@@ -207,67 +696,197 @@ def fetch_reward_benefits(card_titles: List[str]) -> Dict[str, Any]:
     }
 
 
+async def _save_benefits_snapshot(code: str, result: Dict[str, Any]) -> None:
+    """
+    Atomically write one card's benefits to the snapshot; failures are logged, not raised.
+    
+    The write (including fsync) runs in a worker thread so a slow disk never
+    blocks the event loop.
+    """
+    document = {
+        "code": code,
+        "url": result["url"],
+        "fetched_at": time.time(),
+        "data": result["data"]
+    }
+    try:
+        await asyncio.to_thread(benefits_snapshot.save, code, document)
+    except OSError as e:
+        logger.error("❌ Could not write benefits snapshot for %s: %s", code, e)
+
+
+# Snapshot writes started from the request path, referenced until they finish
+_snapshot_writes: Set[asyncio.Task] = set()
+
+
+def _save_benefits_snapshot_in_background(code: str, result: Dict[str, Any]) -> None:
+    """Write one card's snapshot without making the current request wait for the disk."""
+    task = asyncio.get_running_loop().create_task(_save_benefits_snapshot(code, result))
+    _snapshot_writes.add(task)
+    task.add_done_callback(_snapshot_writes.discard)
+
+
+async def refresh_benefits_snapshot(max_age: float = BENEFITS_SNAPSHOT_REFRESH_SECONDS) -> Dict[str, Any]:
+    """
+    Refresh snapshots older than ``max_age`` seconds from upstream.
+    
+    Only one process refreshes at a time (other workers skip the fetch and just
+    pick up the new files). A failed fetch keeps the previous snapshot.
+    
+    Args:
+        max_age: Snapshots fetched less than this many seconds ago are left alone
+        
+    Returns:
+        Dictionary with counts of refreshed and failed cards, and whether this
+        process did the refresh
+    """
+    refreshed = []
+    failed = {}
+    
+    with benefits_snapshot.refresh_lock() as acquired:
+        if acquired:
+            # Another worker may have just refreshed; start from what is on disk
+            await asyncio.to_thread(benefits_snapshot.load)
+            now = time.time()
+            due = {
+                title: metadata["code"]
+                for title, metadata in CARD_METADATA.items()
+                if now - (benefits_snapshot.get(metadata["code"]) or {}).get("fetched_at", 0) >= max_age
+            }
+            
+            if due:
+                logger.info("📸 Refreshing benefits snapshot for %s card(s)", len(due))
+                client = get_http_client()
+                outcomes = await asyncio.gather(*(_fetch_card_benefits(client, title) for title in due))
+                for (title, code), (result, error_msg) in zip(due.items(), outcomes):
+                    if result is None:
+                        failed[code] = error_msg
+                        continue
+                    benefits_cache.set(code, result)
+                    await _save_benefits_snapshot(code, result)
+                    refreshed.append(code)
+                logger.info("📸 Benefits snapshot refresh complete: %s refreshed, %s failed", len(refreshed), len(failed))
+    
+    if not acquired:
+        await asyncio.to_thread(benefits_snapshot.load)
+    
+    return {
+        "refreshed": len(refreshed),
+        "failed": len(failed),
+        "errors": failed if failed else None,
+        "leader": acquired
+    }
+
+
+async def run_benefits_snapshot_refresher(interval: float = BENEFITS_SNAPSHOT_REFRESH_SECONDS) -> None:
+    """
+    Keep ``benefits_snapshot`` fresh until cancelled.
+    
+    Checks roughly every ``interval`` / 10 seconds (at least once a minute) and
+    refetches only snapshots older than ``interval``, so restarts don't refetch
+    everything.
+    """
+    check_every = min(max(interval / 10, 1.0), 60.0)
+    while True:
+        try:
+            await refresh_benefits_snapshot(interval)
+        except Exception as e:
+            logger.error("❌ Benefits snapshot refresh failed: %s", e)
+        await asyncio.sleep(check_every)
+
+
+def get_rates_store() -> RatesStore:
+    """
+    Get the current rates and fees store (see get_card_data).
+    
+    Raises:
+        DataLoadError: If any card's rates and fees file is missing or invalid
+    """
+    return get_card_data().rates_store
+
+
+def get_comparison_facts() -> ComparisonFacts:
+    """
+    Get the current comparison fact table (see get_card_data).
+    
+    Raises:
+        DataLoadError: If any card's rates and fees file is missing or invalid
+    """
+    return get_card_data().comparison_facts
+
+
+def compare_card_facts(card_titles: List[str]) -> Dict[str, Any]:
+    """
+    Build comparison ``benefit_rows`` for one or more cards from the fact table.
+    
+    Args:
+        card_titles: List of card titles or card codes (e.g., ["Active Cash", "MT"])
+        
+    Returns:
+        Dictionary containing:
+        - cards (list): Canonical titles of the resolved cards, in request order
+        - benefit_rows (list): One row per fact (annual fee, intro APR, balance
+          transfer fee, foreign transaction fee, rewards rate) keyed by those titles
+        - errors (list): Cards that could not be resolved, or None
+    """
+    data = get_card_data()
+    titles: List[str] = []
+    errors = []
+    
+    for card_title in card_titles:
+        title = data.title_resolver.resolve(card_title)
+        if title is None:
+            errors.append({"card_title": card_title, "error": f"Unknown card '{card_title}'"})
+        elif title not in titles:
+            titles.append(title)
+    
+    return {
+        "cards": titles,
+        "benefit_rows": data.comparison_facts.benefit_rows(titles),
+        "errors": errors if errors else None,
+    }
+
+
 def fetch_rates_and_fees(card_titles: List[str]) -> Dict[str, Any]:
     """
-    Fetch rates and fees information for one or more credit cards from local JSON files.
+    Fetch rates and fees information for one or more credit cards from the preloaded rates store.
     
     Args:
-        card_titles: List of card titles (e.g., ["Active Cash", "Autograph"])
+        card_titles: List of card titles or card codes (e.g., ["Active Cash", "Autograph", "VV"])
         
     Returns:
         Dictionary with success status, data, and errors
     """
-    logger.info(f"💰 Fetching rates and fees for {len(card_titles)} card(s): {card_titles}")
+    logger.info("💰 Fetching rates and fees for %s card(s): %s", len(card_titles), card_titles)
     
+    data = get_card_data()
+    store = data.rates_store
+    resolver = data.title_resolver
     results = []
     errors = []
     
     for card_title in card_titles:
-        # Clean the card title and convert to filename format
-        clean_title = re.sub(r'<[^>]+>', '', card_title)
-        clean_title = re.sub(r'[®™℠]', '', clean_title).strip()
-        
-        # Convert card title to filename (e.g., "Active Cash" -> "active_cash.json")
-        filename = clean_title.lower().replace(' ', '_') + '.json'
-        filepath = f'json/rates_and_fees/{filename}'
+        title = resolver.resolve(card_title)
+        rates_data = store.get(title) if title else None
         
-        logger.debug(f"Looking for file: {filepath}")
-        
-        try:
-            with open(filepath, 'r') as f:
-                rates_data = json.load(f)
-            
-            results.append({
-                "card_title": card_title,
-                "rates_and_fees": rates_data
-            })
-            logger.info(f"✅ Successfully loaded rates and fees for '{card_title}'")
-            
-        except FileNotFoundError:
-            error_msg = f"Rates and fees file not found for card '{card_title}' (looked for: {filepath})"
-            logger.error(f"❌ {error_msg}")
-            errors.append({
-                "card_title": card_title,
-                "error": error_msg
-            })
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON in rates and fees file for '{card_title}': {str(e)}"
-            logger.error(f"❌ {error_msg}")
-            errors.append({
-                "card_title": card_title,
-                "error": error_msg
-            })
-        except Exception as e:
-            error_msg = f"Error loading rates and fees for '{card_title}': {str(e)}"
-            logger.error(f"❌ {error_msg}")
+        if rates_data is None:
+            error_msg = f"No rates and fees found for card '{card_title}'"
+            logger.error("❌ %s", error_msg)
             errors.append({
                 "card_title": card_title,
                 "error": error_msg
             })
+            continue
+        
+        results.append({
+            "card_title": card_title,
+            "rates_and_fees": rates_data
+        })
+        logger.info("✅ Successfully loaded rates and fees for '%s'", card_title)
     
     success = len(results) > 0
     
-    logger.info(f"📊 Rates and fees fetch complete: {len(results)} successful, {len(errors)} failed")
+    logger.info("📊 Rates and fees fetch complete: %s successful, %s failed", len(results), len(errors))
     
     return {
         "success": success,
@@ -279,59 +898,89 @@ def fetch_rates_and_fees(card_titles: List[str]) -> Dict[str, Any]:
     }
 
 
-def list_cards(category: Optional[CardCategory] = None, no_annual_fee: Optional[bool] = None) -> List[Dict[str, Any]]:
-    logger.info(f"📋 Listing cards with category filter: {category}, no_annual_fee filter: {no_annual_fee}")
+async def fetch_card_details(card_titles: List[str]) -> Dict[str, Any]:
+    """
+    Fetch reward benefits and rates and fees for one or more cards in one call.
     
-    try:
-        with open('json/list_cards.json', 'r') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        logger.error("❌ json/list_cards.json not found")
-        return []
-    except json.JSONDecodeError as e:
-        logger.error(f"❌ Error parsing json/list_cards.json: {str(e)}")
-        return []
-
-    component_objects = data.get('componentObjects', {})
+    Card codes (e.g. "AC", "VV") are accepted alongside titles. Benefits for all
+    cards are fetched concurrently; rates and fees come from the in-memory store.
     
-    if category is None or category == CardCategory.ALL:
-        categories_to_process = [cat.value for cat in CardCategory if cat != CardCategory.ALL]
-    else:
-        categories_to_process = [category.value]
+    Args:
+        card_titles: List of card titles or card codes
+        
+    Returns:
+        Dictionary containing:
+        - success (bool): Whether both lookups fully succeeded
+        - benefits (dict): Result of ``fetch_reward_benefits_async``
+        - rates_and_fees (dict): Result of ``fetch_rates_and_fees``
+        - card_titles (list): Canonical title of each requested card, in request
+          order (the keys of the per-card results)
+        - count (int): Number of cards requested
+    """
+    resolver = get_title_resolver()
+    titles = [resolver.resolve(card_title) or card_title for card_title in card_titles]
+    logger.info("📦 Fetching card details for %s card(s): %s", len(titles), titles)
+    
+    benefits = await fetch_reward_benefits_async(titles)
+    rates = fetch_rates_and_fees(titles)
+    
+    return {
+        "success": benefits["success"] and rates["success"] and not rates["errors"],
+        "benefits": benefits,
+        "rates_and_fees": rates,
+        "card_titles": titles,
+        "count": len(titles)
+    }
+
+
+def _category_key(category: Optional[CardCategory]) -> Optional[str]:
+    """Catalog key for a category filter (None for all categories)."""
+    return None if category is None or category == CardCategory.ALL else category.value
+
+
+def list_cards(category: Optional[CardCategory] = None, no_annual_fee: Optional[bool] = None, dedupe: bool = False) -> CardList:
+    logger.info("📋 Listing cards with category filter: %s, no_annual_fee filter: %s, dedupe: %s", category, no_annual_fee, dedupe)
     
-    logger.debug(f"Processing categories: {categories_to_process}")
+    category_key = _category_key(category)
     
-    all_cards = []
+    # Every filter combination (merged or not) is precomputed by the catalog; this is a single index lookup
+    all_cards = get_catalog().lookup(category_key, no_annual_fee, dedupe)
     
-    for cat in categories_to_process:
-        items = component_objects.get(cat, [])
-        logger.debug(f"Found {len(items)} items in category '{cat}'")
-        
-        for item in items:
-            try:
-                content = item['content']['Component']['Content']
-                card_with_category = {**content, 'category': cat}
-                all_cards.append(card_with_category)
-            except (KeyError, TypeError) as e:
-                logger.debug(f"Skipping invalid item in category '{cat}': {str(e)}")
-                continue
-    
-    # Apply annual fee filter if specified
     if no_annual_fee is not None:
-        def has_matching_fee(card: Dict[str, Any]) -> bool:
-            """Check if card's annual fee matches the filter criteria."""
-            fee_content = card.get('feature6_content', [])
-            if not fee_content or len(fee_content) == 0:
-                return False  # Exclude cards without fee information
-            
-            fee_text = fee_content[0].strip()
-            is_no_fee = fee_text == '$0' or 'none' in fee_text.lower() or fee_text == '0'
-            
-            # Return True if filter matches the fee status
-            return (no_annual_fee and is_no_fee) or (not no_annual_fee and not is_no_fee)
-        
-        all_cards = [card for card in all_cards if has_matching_fee(card)]
-        logger.info(f"🔍 Filtered to {len(all_cards)} cards with {'no' if no_annual_fee else 'an'} annual fee")
+        logger.info("🔍 Filtered to %s cards with %s annual fee", len(all_cards), 'no' if no_annual_fee else 'an')
     
-    logger.info(f"✅ Retrieved {len(all_cards)} credit cards")
+    logger.info("✅ Retrieved %s credit cards", len(all_cards))
     return all_cards
+
+
+def list_card_summaries(category: Optional[CardCategory] = None, no_annual_fee: Optional[bool] = None) -> CardList:
+    """
+    Get the deduplicated summary projection of a card listing.
+    
+    Each card appears once with all of its categories and only the fields the
+    card list widget renders (see ``CardCatalog.lookup_summaries``).
+    """
+    logger.info("📋 Listing card summaries with category filter: %s, no_annual_fee filter: %s", category, no_annual_fee)
+    return get_catalog().lookup_summaries(_category_key(category), no_annual_fee)
+
+
+@lru_cache(maxsize=1)
+def _card_image_urls() -> Dict[str, Optional[str]]:
+    """Versioned local image URL per card title (from CARD_METADATA's image file names)."""
+    images = get_card_images()
+    return {
+        title: images.url_for(metadata["card_image"].rsplit('/', 1)[-1])
+        for title, metadata in CARD_METADATA.items()
+    }
+
+
+def with_card_image_urls(cards: CardList) -> List[Dict[str, Any]]:
+    """
+    Copy card records with an ``image_url`` key for the card list widget.
+    
+    The URL points at the locally served, versioned card image (see
+    ``assets.ImageAsset.url``), or is None for an unknown card. Only listings
+    the widget renders carry it; catalog records and the JSON listing don't.
+    """
+    urls = _card_image_urls()
+    return [{**card, 'image_url': urls.get(clean_card_title(card.get('title', '')))} for card in cards]
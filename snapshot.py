@@ -0,0 +1,116 @@
+"""
+On-disk JSON snapshots for Credit Card Finder MCP Server.
+Keeps a local copy of upstream payloads so requests can be served without an upstream round trip.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class SnapshotStore:
+    """
+    Directory of ``<key>.json`` snapshot documents mirrored in memory.
+
+    Reads are served from memory. ``save`` replaces a file atomically
+    (temp file + ``os.replace``) so readers, including other worker
+    processes, never see a partially written snapshot; ``load`` picks up
+    files changed on disk since the last load. Both do blocking file I/O;
+    async callers run them in a worker thread (``asyncio.to_thread``).
+    """
+
+    LOCK_FILE = ".refresh.lock"
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._mtimes: Dict[str, float] = {}
+
+    def load(self) -> int:
+        """
+        Load snapshot files that are new or changed since the last load.
+
+        Invalid files are logged and skipped. Returns the number of files (re)loaded.
+        """
+        if not self.directory.is_dir():
+            return 0
+
+        loaded = 0
+        for path in self.directory.glob("*.json"):
+            key = path.stem
+            try:
+                mtime = path.stat().st_mtime
+                if self._mtimes.get(key) == mtime:
+                    continue
+                with open(path, 'r') as f:
+                    document = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error("❌ Skipping invalid snapshot %s: %s", path, e)
+                continue
+
+            if not isinstance(document, dict):
+                logger.error("❌ Skipping invalid snapshot %s: expected a JSON object", path)
+                continue
+
+            self._documents[key] = document
+            self._mtimes[key] = mtime
+            loaded += 1
+
+        if loaded:
+            logger.info("📸 Loaded %d snapshot(s) from %s", loaded, self.directory)
+        return loaded
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the snapshot document for ``key`` from memory."""
+        return self._documents.get(key)
+
+    def save(self, key: str, document: Dict[str, Any]) -> None:
+        """Write a snapshot document and atomically swap it into place."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(document, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+        self._documents[key] = document
+        self._mtimes[key] = path.stat().st_mtime
+
+    @contextmanager
+    def refresh_lock(self) -> Iterator[bool]:
+        """
+        Try to become the process that refreshes this directory.
+
+        Yields True if the lock was acquired, False if another process
+        (e.g. another gunicorn worker) holds it.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / self.LOCK_FILE, 'w') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def __len__(self) -> int:
+        return len(self._documents)
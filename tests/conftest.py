@@ -0,0 +1,39 @@
+"""
+Shared fixtures: a counting local upstream (see benchmarks/stub_upstream.py)
+wired into service, with the on-disk benefits snapshot and the response
+cache out of the way so every miss reaches it.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterator
+
+import pytest
+
+import service
+from benchmarks.stub_upstream import StubUpstream, run_stub_upstream
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> Iterator[StubUpstream]:
+    """Stub upstream that service fetches benefit terms from; set ``delay`` per test."""
+    with run_stub_upstream() as stub:
+        monkeypatch.setattr(service, "BASE_URL", stub.base_url)
+        monkeypatch.setattr(service, "BENEFITS_SNAPSHOT_ENABLED", False)
+        service.benefits_cache.clear()
+        try:
+            yield stub
+        finally:
+            service.benefits_cache.clear()
+
+
+@pytest.fixture
+def run() -> Callable[[Awaitable[Any]], Any]:
+    """Run a coroutine on a fresh event loop, closing the shared upstream client afterwards."""
+    def run(awaitable: Awaitable[Any]) -> Any:
+        async def main():
+            try:
+                return await awaitable
+            finally:
+                await service.close_http_client()
+        return asyncio.run(main())
+    return run
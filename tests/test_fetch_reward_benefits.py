@@ -0,0 +1,40 @@
+"""Concurrent benefit fetches: duplicate titles and the overall deadline."""
+
+import asyncio
+import time
+
+import service
+
+
+def _pending_card_fetches():
+    return [task for task in asyncio.all_tasks() if "_get_card_benefits" in repr(task.get_coro())]
+
+
+def test_duplicate_titles_are_fetched_and_reported_once(upstream, run):
+    upstream.delay = 0.05
+
+    result = run(service.fetch_reward_benefits_async(["Active Cash", "Reflect", "Active Cash", "Reflect"]))
+
+    assert upstream.requests == {"AC_benefitTerms": 1, "VV_benefitTerms": 1}
+    assert result["count"] == 2
+    assert result["successful"] == 2 and result["failed"] == 0
+    assert set(result["data"]) == {"Active Cash", "Reflect"}
+
+
+def test_slow_upstream_returns_per_card_errors_within_deadline(upstream, run):
+    upstream.delay = 1.0
+    deadline = 0.2
+
+    async def fetch():
+        start = time.perf_counter()
+        result = await service.fetch_reward_benefits_async(["Active Cash", "Reflect", "Active Cash"], deadline=deadline)
+        return result, time.perf_counter() - start, _pending_card_fetches()
+
+    result, elapsed, pending = run(fetch())
+
+    assert elapsed < deadline + 0.3
+    assert result["count"] == 2
+    assert result["successful"] == 0 and result["failed"] == 2
+    assert all("Deadline" in error for error in result["errors"].values())
+    # Every per-card task, including the repeated title's, was cancelled rather than left running
+    assert pending == []
@@ -0,0 +1,36 @@
+"""Request coalescing of benefit-terms fetches (cache.SingleFlight in service)."""
+
+import asyncio
+
+import service
+
+
+def test_concurrent_misses_for_one_code_make_one_upstream_request(upstream, run):
+    upstream.delay = 0.1
+
+    async def fetch_concurrently():
+        client = service.get_http_client()
+        return await asyncio.gather(*(service._get_card_benefits(client, "Active Cash") for _ in range(20)))
+
+    results = run(fetch_concurrently())
+
+    assert all(error is None for _, error in results)
+    assert upstream.total_requests == 1
+    assert upstream.requests == {"AC_benefitTerms": 1}
+
+
+def test_cancelled_waiter_does_not_cancel_shared_fetch(upstream, run):
+    upstream.delay = 0.3
+
+    async def fetch_with_deadlines():
+        # The first caller gives up before upstream answers; the second, sharing its fetch, still gets the result
+        return await asyncio.gather(
+            service.fetch_reward_benefits_async(["Active Cash"], deadline=0.05),
+            service.fetch_reward_benefits_async(["Active Cash"], deadline=5.0),
+        )
+
+    impatient, patient = run(fetch_with_deadlines())
+
+    assert impatient["failed"] == 1 and "Deadline" in impatient["errors"]["Active Cash"]
+    assert patient["successful"] == 1 and patient["errors"] is None
+    assert upstream.total_requests == 1
@@ -1,29 +1,34 @@
-import json
 import re
 import logging
-from typing import List, Dict, Any
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Tuple, Type
 import mcp.types as types
+from pydantic import BaseModel, ValidationError
 from widgets import widgets, _tool_meta
-from service import list_cards, CardCategory, fetch_reward_benefits, fetch_rates_and_fees
-from schemas import get_schemas
+from catalog import describe_filters
+from service import list_cards, list_card_summaries, CardCategory, compare_card_facts, with_card_image_urls, fetch_reward_benefits_async, fetch_rates_and_fees, get_card_data
+from schemas import CardTitlesInput, CompareCardsOutput, ListCardsInput, NoArgumentsInput, get_schemas
+from metrics import TOOL_CALLS, TOOL_ERRORS, TOOL_LATENCY
+from profiling import profiler
 
-# Setup logging
-logging.basicConfig(level=logging.DEBUG)
+# Setup logging (level is configured by server.py from LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 
-def get_tool_definitions() -> List[types.Tool]:
-    """Get all available tool definitions (widget-based and non-widget tools)."""
+def build_tool_definitions() -> List[types.Tool]:
+    """Build all available tool definitions (widget-based and non-widget tools)."""
     tools = []
     schemas = get_schemas()
     
-    logger.info(f"🔧 Generating tool definitions. Found {len(widgets)} widgets")
+    logger.info("🔧 Generating tool definitions. Found %s widgets", len(widgets))
     
     # Add widget-based tools (with UI)
     for widget in widgets:
         meta = _tool_meta(widget)
-        logger.info(f"✅ Registering widget tool: {widget.identifier}")
-        logger.debug(f"   Widget metadata: {meta}")
+        logger.info("✅ Registering widget tool: %s", widget.identifier)
+        logger.debug("   Widget metadata: %s", meta)
         
         # Get schema for this widget if available
         input_schema = schemas.get(widget.identifier, {
@@ -203,372 +208,271 @@ def get_tool_definitions() -> List[types.Tool]:
     )
     logger.info("✅ Registered non-widget tool: get_all_credit_cards")
     
-    logger.info(f"📋 Total tools registered: {len(tools)}")
+    logger.info("📋 Total tools registered: %s", len(tools))
     return tools
 
 
-async def handle_tool_call(req: types.CallToolRequest) -> types.ServerResult:
+@lru_cache(maxsize=None)
+def _tool_definitions() -> Tuple[types.Tool, ...]:
+    """Tool definitions are static for the life of the process, so build them once."""
+    return tuple(build_tool_definitions())
+
+
+def get_tool_definitions() -> List[types.Tool]:
+    """Get all available tool definitions (built once, then served from memory)."""
+    return list(_tool_definitions())
+
+
+@lru_cache(maxsize=None)
+def get_list_tools_result() -> types.ServerResult:
+    """Get the ListToolsRequest response, built once and reused for every request."""
+    return types.ServerResult(types.ListToolsResult(tools=list(_tool_definitions())))
+
+
+# ============================================================================
+# RESULT ENVELOPES
+# ============================================================================
+
+def _text_content(text: str) -> List[types.TextContent]:
+    return [types.TextContent(type="text", text=text)]
+
+
+def _success_result(text: str, structured_content: Optional[Dict[str, Any]] = None) -> types.ServerResult:
+    """Build a successful tool result, with structuredContent when the widget should render."""
+    return types.ServerResult(types.CallToolResult(
+        content=_text_content(text),
+        structuredContent=structured_content,
+    ))
+
+
+def _error_result(text: str, structured_content: Optional[Dict[str, Any]] = None) -> types.ServerResult:
+    """Build an error tool result."""
+    return types.ServerResult(types.CallToolResult(
+        content=_text_content(text),
+        structuredContent=structured_content,
+        isError=True,
+    ))
+
+
+def _card_batch_result(result: Dict[str, Any], what: str, card_titles: List[str]) -> types.ServerResult:
     """
-    Handle tool call requests by routing to appropriate handlers.
+    Build the success, partial or failure result for a per-card fetch.
     
     Args:
-        req: The tool call request containing tool name and arguments
-        
-    Returns:
-        ServerResult with tool execution results
+        result: Dictionary from a batch fetch (success, successful, failed, ...)
+        what: What was fetched, for messages (e.g. "reward benefits")
+        card_titles: Card titles that were requested
     """
-    tool_name = req.params.name
-    arguments = req.params.arguments or {}
-    
-    logger.info(f"🔧 Handling tool call: {tool_name}")
-    logger.debug(f"   Arguments: {arguments}")
+    if result['success']:
+        logger.info("✅ Successfully fetched %s for all %s card(s)", what, len(card_titles))
+        return _success_result(
+            f"Successfully retrieved {what} for {result['successful']} card(s): {', '.join(card_titles)}",
+            result,
+        )
     
-    # Route to appropriate handler
-    if tool_name == "list_wells_fargo_credit_cards":
-        return await _handle_list_wells_fargo_credit_cards(arguments)
-    elif tool_name == "compare_credit_cards":
-        return await _handle_compare_cards(arguments)
-    elif tool_name == "fetch_rewards_and_benefits":
-        return await _handle_fetch_rewards_and_benefits(arguments)
-    elif tool_name == "fetch_rates_and_fees":
-        return await _handle_fetch_rates_and_fees(arguments)
-    elif tool_name == "get_all_credit_cards":
-        return await _handle_get_all_credit_cards(arguments)
-    else:
-        error_msg = f"Unknown tool: {tool_name}"
-        logger.error(f"❌ {error_msg}")
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=error_msg
-                )],
-                isError=True,
-            )
+    if result['successful'] > 0:
+        logger.warning("⚠️ Partial success: %s successful, %s failed", result['successful'], result['failed'])
+        return _success_result(
+            f"Partially retrieved {what}: {result['successful']} successful, {result['failed']} failed. Check 'errors' field for details.",
+            result,
         )
+    
+    logger.error("❌ Failed to fetch %s for all cards", what)
+    return _error_result(
+        f"Error: Failed to fetch {what} for all {len(card_titles)} card(s). Check 'errors' field for details.",
+        result,
+    )
+
+
+def _validation_error_result(tool_name: str, error: ValidationError) -> types.ServerResult:
+    """Build an error result listing each invalid argument."""
+    problems = "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'arguments'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+    logger.warning("⚠️  Invalid arguments for %s: %s", tool_name, problems)
+    return _error_result(f"Error: invalid arguments for {tool_name}: {problems}")
 
 
-async def _handle_list_wells_fargo_credit_cards(arguments: Dict[str, Any]) -> types.ServerResult:
+# ============================================================================
+# TOOL HANDLERS
+# ============================================================================
+
+async def _handle_list_wells_fargo_credit_cards(params: ListCardsInput) -> types.ServerResult:
     """Handle list_wells_fargo_credit_cards tool call with optional category and annual fee filters."""
     logger.info("💳 Handling list_wells_fargo_credit_cards request")
     
-    # Get category from arguments if provided
-    category = None
-    if arguments and "category" in arguments:
-        category_str = arguments["category"]
-        try:
-            category = CardCategory(category_str)
-            logger.info(f"🏷️  Filtering by category: {category.value}")
-        except ValueError:
-            logger.warning(f"⚠️  Invalid category '{category_str}', returning all cards")
-    
-    # Get no_annual_fee filter from arguments if provided
-    no_annual_fee = arguments.get("no_annual_fee") if arguments else None
+    category = CardCategory(params.category)
+    no_annual_fee = params.no_annual_fee
+    if category != CardCategory.ALL:
+        logger.info("🏷️  Filtering by category: %s", category.value)
     if no_annual_fee is not None:
-        logger.info(f"💰 Filtering by annual fee: {'No annual fee' if no_annual_fee else 'Has annual fee'}")
+        logger.info("💰 Filtering by annual fee: %s", 'No annual fee' if no_annual_fee else 'Has annual fee')
     
-    try:
-        cards = list_cards(category, no_annual_fee)
-        
-        logger.info(f"✅ Retrieved {len(cards)} credit cards successfully")
-        
-        # Build filter description for response message
-        filter_parts = []
-        if category and category != CardCategory.ALL:
-            filter_parts.append(f"in {category.value} category")
-        if no_annual_fee is True:
-            filter_parts.append("with no annual fee")
-        elif no_annual_fee is False:
-            filter_parts.append("with annual fee")
-        
-        filter_desc = " ".join(filter_parts) if filter_parts else ""
-        
-        # structuredContent must be a dictionary, not a list
-        # Wrap the cards list in a dictionary
-        result = types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=f"Successfully retrieved {len(cards)} Wells Fargo credit cards{' ' + filter_desc if filter_desc else ''}."
-                )],
-                structuredContent={"cards": cards},
-            )
-        )
-        
-        logger.info("📦 Returning CallToolResult with structuredContent")
-        logger.debug(f"   Card count: {len(cards)}")
-        logger.info("🎨 This response should trigger widget display (has structuredContent)")
-        
-        return result
-    except Exception as e:
-        logger.error(f"❌ Error retrieving cards: {str(e)}")
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=f"Error retrieving credit cards: {str(e)}"
-                )],
-                isError=True,
-            )
-        )
-
-
-async def _handle_compare_cards(arguments: Dict[str, Any]) -> types.ServerResult:
-    """Handle compare_cards tool call to display comparison UI."""
-    logger.info("⚖️  Handling compare_cards request")
+    if params.view == "summary":
+        cards = list_card_summaries(category, no_annual_fee)
+    else:
+        cards = list_cards(category, no_annual_fee, params.dedupe)
+    logger.info("✅ Retrieved %s credit cards successfully (%s view)", len(cards), params.view)
     
-    # Validate required fields
-    cards = arguments.get("cards")
-    benefit_rows = arguments.get("benefit_rows")
-    recommended_card = arguments.get("recommended_card")
+    filter_desc = describe_filters(None if category == CardCategory.ALL else category.value, no_annual_fee)
     
-    if not cards or not isinstance(cards, list):
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text="Error: 'cards' parameter is required and must be a list of card names"
-                )],
-                isError=True,
-            )
-        )
+    logger.debug("   Card count: %s", len(cards))
     
-    if not benefit_rows or not isinstance(benefit_rows, list):
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text="Error: 'benefit_rows' parameter is required and must be a list of benefit objects"
-                )],
-                isError=True,
-            )
-        )
-    
-    try:
-        logger.info(f"✅ Displaying comparison for {len(cards)} card(s) with {len(benefit_rows)} benefit rows")
-        
-        result = types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=f"Displaying comparison of {len(cards)} credit cards: {', '.join(cards)}"
-                )],
-                structuredContent=arguments,
-            )
-        )
-        
-        logger.info("📦 Returning CallToolResult with comparison data")
-        logger.info("🎨 This response should trigger widget display (has structuredContent)")
-        
-        return result
-    except Exception as e:
-        logger.error(f"❌ Error in compare_cards: {str(e)}")
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=f"Error displaying card comparison: {str(e)}"
-                )],
-                isError=True,
-            )
-        )
+    # structuredContent must be a dictionary, not a list, and triggers the widget display
+    return _success_result(
+        f"Successfully retrieved {len(cards)} Wells Fargo credit cards{' ' + filter_desc if filter_desc else ''}.",
+        {"cards": with_card_image_urls(cards)},
+    )
 
 
-async def _handle_fetch_rewards_and_benefits(arguments: Dict[str, Any]) -> types.ServerResult:
-    """Handle fetch_rewards_and_benefits tool call."""
-    logger.info("🎁 Handling fetch_rewards_and_benefits request")
+async def _handle_compare_cards(params: CompareCardsOutput, arguments: Dict[str, Any]) -> types.ServerResult:
+    """
+    Handle compare_cards tool call to display comparison UI.
     
-    card_titles = arguments.get("card_titles")
-    if not card_titles:
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text="Error: card_titles parameter is required (must be a list of card names)"
-                )],
-                isError=True,
-            )
+    Without ``benefit_rows`` the rows are assembled from the comparison fact
+    table, and ``cards`` is replaced by the resolved titles the rows are keyed
+    by (in request order, each card once). ``cards`` only accepts the card
+    names in the schema, so card codes are not accepted here.
+    """
+    if params.benefit_rows is None:
+        facts = compare_card_facts(params.cards)
+        cards = facts["cards"]
+        structured_content = {**arguments, "cards": cards, "benefit_rows": facts["benefit_rows"]}
+        if facts["errors"]:
+            structured_content["errors"] = facts["errors"]
+        logger.info("✅ Displaying comparison for %s card(s) from the fact table", len(cards))
+        return _success_result(
+            f"Displaying comparison of {len(cards)} credit cards: {', '.join(cards)}",
+            structured_content,
         )
     
-    if not isinstance(card_titles, list):
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text="Error: card_titles must be a list (array) of card names"
-                )],
-                isError=True,
-            )
-        )
+    logger.info("✅ Displaying comparison for %s card(s) with %s benefit rows", len(params.cards), len(params.benefit_rows))
     
-    try:
-        result = fetch_reward_benefits(card_titles)
-        
-        if result['success']:
-            logger.info(f"✅ Successfully fetched reward benefits for all {len(card_titles)} card(s)")
-            return types.ServerResult(
-                types.CallToolResult(
-                    content=[types.TextContent(
-                        type="text",
-                        text=f"Successfully retrieved reward benefits for {result['successful']} card(s): {', '.join(card_titles)}"
-                    )],
-                    structuredContent=result,
-                )
-            )
-        elif result['successful'] > 0:
-            # Partial success
-            logger.warning(f"⚠️ Partial success: {result['successful']} successful, {result['failed']} failed")
-            return types.ServerResult(
-                types.CallToolResult(
-                    content=[types.TextContent(
-                        type="text",
-                        text=f"Partially retrieved reward benefits: {result['successful']} successful, {result['failed']} failed. Check 'errors' field for details."
-                    )],
-                    structuredContent=result,
-                )
-            )
-        else:
-            logger.error(f"❌ Failed to fetch reward benefits for all cards")
-            return types.ServerResult(
-                types.CallToolResult(
-                    content=[types.TextContent(
-                        type="text",
-                        text=f"Error: Failed to fetch reward benefits for all {len(card_titles)} card(s). Check 'errors' field for details."
-                    )],
-                    structuredContent=result,
-                    isError=True,
-                )
-            )
-    except Exception as e:
-        logger.error(f"❌ Error in fetch_rewards_and_benefits: {str(e)}")
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=f"Error fetching reward benefits: {str(e)}"
-                )],
-                isError=True,
-            )
-        )
+    # The widget renders the arguments exactly as the model sent them
+    return _success_result(
+        f"Displaying comparison of {len(params.cards)} credit cards: {', '.join(params.cards)}",
+        arguments,
+    )
 
 
-async def _handle_fetch_rates_and_fees(arguments: Dict[str, Any]) -> types.ServerResult:
+async def _handle_fetch_rewards_and_benefits(params: CardTitlesInput) -> types.ServerResult:
+    """Handle fetch_rewards_and_benefits tool call."""
+    result = await fetch_reward_benefits_async(params.card_titles)
+    return _card_batch_result(result, "reward benefits", params.card_titles)
+
+
+async def _handle_fetch_rates_and_fees(params: CardTitlesInput) -> types.ServerResult:
     """Handle fetch_rates_and_fees tool call."""
-    logger.info("💰 Handling fetch_rates_and_fees request")
+    result = fetch_rates_and_fees(params.card_titles)
+    return _card_batch_result(result, "rates and fees", params.card_titles)
+
+
+# get_all_credit_cards result, with the card data version it was built from
+_all_cards_result: Optional[Tuple[int, types.ServerResult]] = None
+
+
+async def _handle_get_all_credit_cards(params: NoArgumentsInput) -> types.ServerResult:
+    """
+    Handle get_all_credit_cards tool call - returns all cards without any filters or UI widget.
     
-    card_titles = arguments.get("card_titles")
-    if not card_titles:
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text="Error: card_titles parameter is required (must be a list of card names)"
-                )],
-                isError=True,
-            )
-        )
+    The result never changes for a card data version, so it is built once per
+    version and reused.
+    """
+    global _all_cards_result
+    data = get_card_data()
+    if _all_cards_result is None or _all_cards_result[0] != data.version:
+        # The unfiltered listing's JSON text was serialized when the catalog loaded.
+        # Return data WITHOUT structuredContent to avoid triggering UI widget
+        _all_cards_result = (data.version, _success_result(data.catalog.listing_json(None, None)))
     
-    if not isinstance(card_titles, list):
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text="Error: card_titles must be a list (array) of card names"
-                )],
-                isError=True,
-            )
-        )
+    logger.info("📋 Listing all cards (card data version %s)", data.version)
+    return _all_cards_result[1]
+
+
+# ============================================================================
+# TOOL REGISTRY
+# ============================================================================
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """How to validate and run one tool."""
+    input_model: Type[BaseModel]
+    handler: Callable[..., Awaitable[types.ServerResult]]
+    error_message: str                 # Prefix for unexpected handler errors
+    pass_arguments: bool = False       # Also pass the raw arguments dict to the handler
+
+
+TOOL_REGISTRY: Dict[str, ToolSpec] = {
+    "list_wells_fargo_credit_cards": ToolSpec(
+        ListCardsInput, _handle_list_wells_fargo_credit_cards, "Error retrieving credit cards"),
+    "compare_credit_cards": ToolSpec(
+        CompareCardsOutput, _handle_compare_cards, "Error displaying card comparison", pass_arguments=True),
+    "fetch_rewards_and_benefits": ToolSpec(
+        CardTitlesInput, _handle_fetch_rewards_and_benefits, "Error fetching reward benefits"),
+    "fetch_rates_and_fees": ToolSpec(
+        CardTitlesInput, _handle_fetch_rates_and_fees, "Error fetching rates and fees"),
+    "get_all_credit_cards": ToolSpec(
+        NoArgumentsInput, _handle_get_all_credit_cards, "Error retrieving credit cards"),
+}
+
+
+async def handle_tool_call(req: types.CallToolRequest) -> types.ServerResult:
+    """
+    Handle tool call requests by routing to appropriate handlers.
     
-    try:
-        result = fetch_rates_and_fees(card_titles)
+    Records call count, error count and latency per tool (see metrics.py);
+    unknown tool names are recorded as "unknown". When profiling is enabled,
+    a sample of calls is profiled (see profiling.py).
+    
+    Args:
+        req: The tool call request containing tool name and arguments
         
-        if result['success']:
-            logger.info(f"✅ Successfully fetched rates and fees for all {len(card_titles)} card(s)")
-            return types.ServerResult(
-                types.CallToolResult(
-                    content=[types.TextContent(
-                        type="text",
-                        text=f"Successfully retrieved rates and fees for {result['successful']} card(s): {', '.join(card_titles)}"
-                    )],
-                    structuredContent=result,
-                )
-            )
-        elif result['successful'] > 0:
-            # Partial success
-            logger.warning(f"⚠️ Partial success: {result['successful']} successful, {result['failed']} failed")
-            return types.ServerResult(
-                types.CallToolResult(
-                    content=[types.TextContent(
-                        type="text",
-                        text=f"Partially retrieved rates and fees: {result['successful']} successful, {result['failed']} failed. Check 'errors' field for details."
-                    )],
-                    structuredContent=result,
-                )
-            )
+    Returns:
+        ServerResult with tool execution results
+    """
+    tool_name = req.params.name
+    label = tool_name if tool_name in TOOL_REGISTRY else "unknown"
+    TOOL_CALLS.inc(label)
+    start = time.perf_counter()
+    failed = True
+    try:
+        arguments = req.params.arguments or {}
+        if profiler.enabled:
+            result = await profiler.run("tool", label, arguments, _dispatch_tool_call(tool_name, arguments))
         else:
-            logger.error(f"❌ Failed to fetch rates and fees for all cards")
-            return types.ServerResult(
-                types.CallToolResult(
-                    content=[types.TextContent(
-                        type="text",
-                        text=f"Error: Failed to fetch rates and fees for all {len(card_titles)} card(s). Check 'errors' field for details."
-                    )],
-                    structuredContent=result,
-                    isError=True,
-                )
-            )
-    except Exception as e:
-        logger.error(f"❌ Error in fetch_rates_and_fees: {str(e)}")
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=f"Error fetching rates and fees: {str(e)}"
-                )],
-                isError=True,
-            )
-        )
+            result = await _dispatch_tool_call(tool_name, arguments)
+        failed = bool(getattr(result.root, "isError", False))
+        return result
+    finally:
+        TOOL_LATENCY.observe(time.perf_counter() - start, label)
+        if failed:
+            TOOL_ERRORS.inc(label)
 
 
-async def _handle_get_all_credit_cards(arguments: Dict[str, Any]) -> types.ServerResult:
-    """Handle get_all_credit_cards tool call - returns all cards without any filters or UI widget."""
-    logger.info("📋 Handling get_all_credit_cards request (no filters, no UI widget)")
+async def _dispatch_tool_call(tool_name: str, arguments: Dict[str, Any]) -> types.ServerResult:
+    """Validate a tool call's arguments against its input model and run its handler."""
+    logger.info("🔧 Handling tool call: %s", tool_name)
+    logger.debug("   Arguments: %s", arguments)
+    
+    spec = TOOL_REGISTRY.get(tool_name)
+    if spec is None:
+        error_msg = f"Unknown tool: {tool_name}"
+        logger.error("❌ %s", error_msg)
+        return _error_result(error_msg)
     
     try:
-        # Pass None for both category and no_annual_fee to get ALL cards without any filtering
-        cards = list_cards(None, None)
-        
-        logger.info(f"✅ Retrieved all {len(cards)} credit cards successfully (no filters applied)")
-        
-        # Return data WITHOUT structuredContent to avoid triggering UI widget
-        result = types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "message": f"Successfully retrieved all {len(cards)} Wells Fargo credit cards.",
-                        "count": len(cards),
-                        "cards": cards
-                    }, indent=2)
-                )],
-            )
-        )
-        
-        logger.info("📦 Returning CallToolResult WITHOUT structuredContent (no UI widget)")
-        logger.debug(f"   Card count: {len(cards)}")
-        
-        return result
+        params = spec.input_model.model_validate(arguments)
+    except ValidationError as e:
+        return _validation_error_result(tool_name, e)
+    
+    try:
+        if spec.pass_arguments:
+            return await spec.handler(params, arguments)
+        return await spec.handler(params)
     except Exception as e:
-        logger.error(f"❌ Error retrieving cards: {str(e)}")
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(
-                    type="text",
-                    text=f"Error retrieving credit cards: {str(e)}"
-                )],
-                isError=True,
-            )
-        )
+        logger.error("❌ Error in %s: %s", tool_name, e)
+        return _error_result(f"{spec.error_message}: {str(e)}")
 
 
 if __name__ == '__main__':
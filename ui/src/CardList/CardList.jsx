@@ -50,6 +50,10 @@ import placeholderImg from './images/placeholder.svg';
 
 console.log('🎯 CardList module loaded');
 
+// Public URL of the MCP server for API calls and server-hosted card images,
+// injected by the server into the widget HTML (PUBLIC_BASE_URL)
+const API_BASE_URL = window.CARD_FINDER_API_BASE_URL || '';
+
 // Map card titles to imported images (exact matches from data.json)
 const imageMap = {
   'Active Cash®': activeCashImg,
@@ -75,7 +79,7 @@ const stripHtml = (html) => {
   return decoded.replace(/<[^>]*>/g, '').trim();
 };
 
-const getCardImage = (cardTitle) => {
+const getBundledImage = (cardTitle) => {
   // Try exact match first
   if (imageMap[cardTitle]) {
     return imageMap[cardTitle];
@@ -89,6 +93,14 @@ const getCardImage = (cardTitle) => {
   return titleKey ? imageMap[titleKey] : placeholderImg;
 };
 
+const getCardImage = (card) => {
+  // Prefer the server-hosted image (versioned URL, cached by the browser for good)
+  if (card.image_url && API_BASE_URL) {
+    return `${API_BASE_URL}${card.image_url}`;
+  }
+  return getBundledImage(card.title);
+};
+
 const CardListComponent = () => {
   console.log('💳 CardList rendering');
   
@@ -109,51 +121,56 @@ const CardListComponent = () => {
       return;
     }
     
-    console.log(`🔄 Fetching details for: ${cardTitle}`);
-    setLoadingDetails(prev => ({ ...prev, [index]: true }));
+    // Load every listed card that isn't loaded yet in the same request, so expanding
+    // several cards takes one round trip (repeated card_title parameters)
+    const listedCards = (Array.isArray(toolOutput) ? toolOutput : toolOutput?.cards) || [];
+    const indexesByTitle = { [cardTitle]: [index] };
+    listedCards.forEach((card, cardIndex) => {
+      if (cardIndex === index || cardDetails[cardIndex] || loadingDetails[cardIndex]) return;
+      (indexesByTitle[card.title] = indexesByTitle[card.title] || []).push(cardIndex);
+    });
+    const titles = Object.keys(indexesByTitle);
+    const indexes = titles.flatMap(title => indexesByTitle[title]);
     
-    // Use ngrok URL for API calls
-    const API_BASE_URL = 'https://075afded9b12.ngrok-free.app';
+    console.log(`🔄 Fetching details for ${titles.length} card(s), starting with: ${cardTitle}`);
+    setLoadingDetails(prev => ({ ...prev, ...Object.fromEntries(indexes.map(i => [i, true])) }));
     
     try {
-      // Fetch both reward benefits and rates & fees in parallel
-      const [benefitsResponse, ratesResponse] = await Promise.all([
-        fetch(`${API_BASE_URL}/api/fetch_reward_benefits?card_title=${encodeURIComponent(cardTitle)}`, {
-          headers: { 'ngrok-skip-browser-warning': 'true' }
-        }),
-        fetch(`${API_BASE_URL}/api/fetch_rates_and_fees?card_title=${encodeURIComponent(cardTitle)}`, {
-          headers: { 'ngrok-skip-browser-warning': 'true' }
-        })
-      ]);
+      // Fetch reward benefits and rates & fees for all of them together in one round trip
+      const query = titles.map(title => `card_title=${encodeURIComponent(title)}`).join('&');
+      const detailsResponse = await fetch(`${API_BASE_URL}/api/fetch_card_details?${query}`, {
+        headers: { 'ngrok-skip-browser-warning': 'true' }
+      });
       
-      const benefitsData = await benefitsResponse.json();
-      const ratesData = await ratesResponse.json();
+      const detailsData = await detailsResponse.json();
+      const benefitsData = detailsData.benefits || detailsData;
+      const ratesData = detailsData.rates_and_fees || detailsData;
+      // Canonical title of each requested card, in request order (keys of the results below)
+      const resolvedTitles = detailsData.card_titles || titles;
       
       console.log('📥 Benefits data:', benefitsData);
       console.log('💰 Rates & Fees data:', ratesData);
       
-      // Extract the benefits data for this specific card
-      let extractedBenefits = null;
-      if (benefitsData.success && benefitsData.data) {
-        const cardName = Object.keys(benefitsData.data)[0];
-        if (cardName && benefitsData.data[cardName] && benefitsData.data[cardName].data) {
-          extractedBenefits = benefitsData.data[cardName].data.data;
-        }
-      }
-      
-      // Extract rates and fees data
-      let extractedRates = null;
-      if (ratesData.success && ratesData.data && ratesData.data.length > 0) {
-        extractedRates = ratesData.data[0].rates_and_fees;
-      }
-      
-      setCardDetails(prev => ({
-        ...prev,
-        [index]: {
-          benefits: extractedBenefits ? { success: true, data: extractedBenefits } : benefitsData,
-          rates: extractedRates ? { success: true, data: extractedRates } : ratesData
-        }
-      }));
+      const loaded = {};
+      titles.forEach((title, position) => {
+        const resolvedTitle = resolvedTitles[position];
+        
+        // Extract the benefits data for this specific card
+        const benefitsEntry = benefitsData.data && benefitsData.data[resolvedTitle];
+        const extractedBenefits = benefitsEntry && benefitsEntry.data ? benefitsEntry.data.data : null;
+        
+        // Extract rates and fees data
+        const ratesEntry = (ratesData.data || []).find(entry => entry.card_title === resolvedTitle);
+        const extractedRates = ratesEntry ? ratesEntry.rates_and_fees : null;
+        
+        indexesByTitle[title].forEach(cardIndex => {
+          loaded[cardIndex] = {
+            benefits: extractedBenefits ? { success: true, data: extractedBenefits } : benefitsData,
+            rates: extractedRates ? { success: true, data: extractedRates } : ratesData
+          };
+        });
+      });
+      setCardDetails(prev => ({ ...prev, ...loaded }));
       
       // Flip the card after data is loaded
       handleCardFlip(index);
@@ -162,7 +179,7 @@ const CardListComponent = () => {
       // Still flip the card even if fetch fails
       handleCardFlip(index);
     } finally {
-      setLoadingDetails(prev => ({ ...prev, [index]: false }));
+      setLoadingDetails(prev => ({ ...prev, ...Object.fromEntries(indexes.map(i => [i, false])) }));
     }
   };
   
@@ -207,8 +224,8 @@ const CardListComponent = () => {
     <Container>
       <ScrollContainer>
         {cards.map((card, index) => {
-          // Get the bundled image using card title
-          const imageUrl = getCardImage(card.title);
+          // Get the server-hosted image, falling back to the bundled one by card title
+          const imageUrl = getCardImage(card);
           const isFlipped = flippedCards[index] || false;
           
           return (
@@ -221,7 +238,9 @@ const CardListComponent = () => {
                       src={imageUrl} 
                       alt={card.title}
                       onError={(e) => {
-                        e.target.src = placeholderImg;
+                        // Server image unreachable (offline, tunnel rotated): use the bundled art, then the placeholder
+                        const bundledImg = getBundledImage(card.title);
+                        e.target.src = e.target.src === bundledImg ? placeholderImg : bundledImg;
                         console.warn(`Failed to load image for: ${card.title}`);
                       }}
                     />
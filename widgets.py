@@ -2,13 +2,22 @@
 UI Widget configurations for Credit Card Finder MCP Server.
 """
 
+import gzip
+import hashlib
+import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
-# Setup logging
-logging.basicConfig(level=logging.DEBUG)
+from config import PUBLIC_BASE_URL
+
+try:
+    import brotli
+except ImportError:  # Optional: brotli bodies are only precomputed when installed
+    brotli = None
+
+# Setup logging (level is configured by server.py from LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 logger.info("=" * 80)
@@ -20,6 +29,7 @@ bundle_path = WEB_DIR / "dist/card-list.js"
 
 # Check if UI bundles exist (but don't load them yet - lazy load on demand)
 HAS_UI = bundle_path.exists()
+UI_NOT_AVAILABLE_HTML = "<div>UI not available. Build React components first.</div>"
 
 # Example format for compare_cards tool
 COMPARE_CARDS_EXAMPLE = '''{
@@ -57,14 +67,14 @@ COMPARE_CARDS_EXAMPLE = '''{
 
 # Lazy-load function to load bundles only when needed
 def _load_bundle(bundle_name: str) -> str:
-    """Lazy-load a bundle file when needed, with caching."""
+    """Lazy-load a bundle file when needed (callers memoize the result)."""
     try:
         bundle_file = WEB_DIR / f"dist/{bundle_name}.js"
         logger.debug(f"📦 Loading bundle: {bundle_name}.js")
         return bundle_file.read_text()
     except FileNotFoundError as e:
         logger.error(f"❌ Bundle not found: {bundle_name}.js")
-        return "<div>UI not available. Build React components first.</div>"
+        return UI_NOT_AVAILABLE_HTML
 
 
 logger.info(f"✅ UI bundles available: {HAS_UI}")
@@ -74,6 +84,41 @@ logger.info(f"✅ UI bundles available: {HAS_UI}")
 MIME_TYPE = "text/html+skybridge"
 
 
+@dataclass(frozen=True)
+class RenderedWidget:
+    """Final widget HTML with precomputed compressed bodies and ETag."""
+    html: str
+    body: bytes                    # UTF-8 encoded html
+    gzip_body: bytes
+    brotli_body: Optional[bytes]   # None when brotli isn't installed
+    etag: str
+    bundle_mtime: Optional[float]  # mtime of the bundle the HTML was built from
+
+    @classmethod
+    def build(cls, html: str, bundle_mtime: Optional[float]) -> "RenderedWidget":
+        body = html.encode("utf-8")
+        return cls(
+            html=html,
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+            brotli_body=brotli.compress(body) if brotli is not None else None,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            bundle_mtime=bundle_mtime,
+        )
+
+
+# Rendered widgets by identifier, rebuilt when the bundle's mtime changes
+_rendered_widgets: Dict[str, RenderedWidget] = {}
+
+
+def _bundle_mtime(bundle_name: str) -> Optional[float]:
+    """Get the bundle file's mtime, or None if it doesn't exist."""
+    try:
+        return (WEB_DIR / f"dist/{bundle_name}.js").stat().st_mtime
+    except OSError:
+        return None
+
+
 @dataclass(frozen=True)
 class CreditCardWidget:
     """Credit Card Widget configuration for card display."""
@@ -87,12 +132,32 @@ class CreditCardWidget:
     root_id: str      # Root element ID for React mounting
     response_text: str
     
+    def render(self) -> RenderedWidget:
+        """
+        Get this widget's rendered HTML and compressed bodies.
+        
+        The HTML is built once per bundle mtime and then served from memory.
+        """
+        bundle_mtime = _bundle_mtime(self.bundle_name) if HAS_UI else None
+        rendered = _rendered_widgets.get(self.identifier)
+        if rendered is None or rendered.bundle_mtime != bundle_mtime:
+            logger.info(f"🧱 Rendering widget HTML: {self.identifier}")
+            rendered = RenderedWidget.build(self._build_html(), bundle_mtime)
+            _rendered_widgets[self.identifier] = rendered
+        return rendered
+    
     def get_html(self) -> str:
-        """Lazy-load and generate HTML for this widget."""
+        """Get the (memoized) HTML for this widget."""
+        return self.render().html
+    
+    def _build_html(self) -> str:
+        """Load the bundle and generate HTML for this widget."""
         if not HAS_UI:
-            return "<div>UI not available. Build React components first.</div>"
+            return UI_NOT_AVAILABLE_HTML
         
         bundle_content = _load_bundle(self.bundle_name)
+        # "</" is escaped so the URL can't close the script element
+        api_base_url = json.dumps(PUBLIC_BASE_URL).replace("</", "<\\/")
         return (
             f"<style>\n"
             f"  * {{ margin: 0; padding: 0; box-sizing: border-box; }}\n"
@@ -100,6 +165,7 @@ class CreditCardWidget:
             f"  #{self.root_id} {{ margin: 0; padding: 0; width: 100%; }}\n"
             f"</style>\n"
             f"<div id=\"{self.root_id}\"></div>\n"
+            f"<script>window.CARD_FINDER_API_BASE_URL = {api_base_url};</script>\n"
             f"<script type=\"module\">\n{bundle_content}\n</script>"
         )
     
@@ -180,6 +246,10 @@ widgets: List[CreditCardWidget] = [
             "2. Call 'fetch_rates_and_fees' with same card names to get rates and fee data\n"
             "3. Analyze the data, then call THIS tool to display the formatted comparison table with your recommendation\n"
             "\n"
+            "**FACT-TABLE MODE**: To compare the standard facts (annual fee, intro APR, balance transfer fee, "
+            "foreign transaction fees, rewards rate), call THIS tool directly with 'cards' and 'recommended_card' "
+            "and omit 'benefit_rows'; the server fills them in. Steps 1 and 2 are then not needed.\n"
+            "\n"
             "**WHY THIS TOOL IS MANDATORY**:\n"
             "- Shows detailed side-by-side comparison in clean, formatted table\n"
             "- Helps users visually compare features and make their own choice\n"